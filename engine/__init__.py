@@ -162,6 +162,7 @@ from .core.components.ui.grid import Grid, GridColumn
 from .core.components.ui.image import Image, Icon
 from .core.components.ui.scrollview import ScrollView
 from .core.components.ui.titled_panel import TitledPanel
+from .core.components.ui.font_registry import get_font, render_text, clear_fonts, on_fonts_cleared
 
 __all__ = [
     # Core components
@@ -217,7 +218,11 @@ __all__ = [
     'Image',
     'Icon',
     'ScrollView',
-    'TitledPanel'
+    'TitledPanel',
+    'get_font',
+    'render_text',
+    'clear_fonts',
+    'on_fonts_cleared'
 ]
 
 
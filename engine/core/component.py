@@ -1,4 +1,12 @@
 class Component:
+    # Subclasses that declare their own __slots__ stay dict-free; the rest keep a __dict__ as before
+    __slots__ = ('entity', 'enabled')
+
+    # Components driven by a scene-level system set this to False; an entity whose
+    # components all opt out is skipped by the scene's per-frame update walk while
+    # its velocity and acceleration are zero (otherwise it is updated to keep moving)
+    needs_update = True
+
     def __init__(self):
         self.entity = None
         self.enabled = True
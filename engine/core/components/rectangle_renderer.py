@@ -9,6 +9,21 @@ class RectangleRenderer(Component):
         self.height = height
         self.color = color
         self.offset = pygame.math.Vector2(0, 0)
+        # Pre-filled surface, rebuilt only when size or color change
+        self._surface = None
+        self._surface_key = None
+
+    def _get_surface(self) -> pygame.Surface:
+        key = (self.width, self.height, tuple(self.color))
+        if key != self._surface_key:
+            surface = pygame.Surface((max(0, int(self.width)), max(0, int(self.height))))
+            surface.fill(self.color)
+            # Match the display format so blits are plain copies
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self._surface = surface
+            self._surface_key = key
+        return self._surface
 
     def render(self, screen: pygame.Surface, camera_offset=(0, 0)):
         if not self.enabled or not self.entity:
@@ -19,13 +34,10 @@ class RectangleRenderer(Component):
             self.entity.position.y - camera_offset[1] + self.offset.y
         )
 
-        pygame.draw.rect(
-            screen,
-            self.color,
+        screen.blit(
+            self._get_surface(),
             (render_pos[0] - self.width/2,
-             render_pos[1] - self.height/2,
-             self.width,
-             self.height)
+             render_pos[1] - self.height/2)
         )
 
     def set_color(self, color: Tuple[int, int, int]):
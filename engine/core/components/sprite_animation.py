@@ -23,6 +23,8 @@ class Animation:
         self.on_finish_callback: Optional[Callable] = None
         self.on_frame_callback: Optional[Callable[[int], None]] = None
         self.queued_animation: Optional[str] = None
+        # Frames per (flip_x, flip_y) state, filled in by SpriteAnimation.set_flip
+        self.flipped_frames: Dict[Tuple[bool, bool], List[pygame.Surface]] = {}
     
     def reset(self):
         self.current_frame = 0
@@ -89,14 +91,9 @@ class SpriteAnimation(Component):
         # Use ResourceManager to extract and cache frames
         sheet_width = self.sprite_sheet.get_width()
         max_x = sheet_width if lane_width is None else start_x + lane_width
-        actual_frame_count = frame_count
         
         # Calculate actual frame count based on lane width
-        for i in range(frame_count):
-            x = start_x + (i * frame_width)
-            if x + frame_width > max_x:
-                actual_frame_count = i
-                break
+        actual_frame_count = max(0, min(frame_count, (max_x - start_x) // frame_width))
         
         # Use ResourceManager to extract and cache frames with transformations
         return self.resource_manager.extract_sprite_frames(
@@ -248,50 +245,26 @@ class SpriteAnimation(Component):
                 self.play(current_anim)
     
     def set_flip(self, flip_x: bool, flip_y: bool):
-        """Set the flip state of the sprite"""
+        """Set the flip state of the sprite
+        
+        Each animation keeps its frames for every flip state it has been shown in, so
+        switching back and forth (e.g. walking left and right) only swaps frame lists.
+        Playback state, speed and callbacks are kept.
+        """
         if self.flip_x == flip_x and self.flip_y == flip_y:
             return
         
+        for anim in self.animations.values():
+            anim.flipped_frames.setdefault((self.flip_x, self.flip_y), anim.frames)
+            frames = anim.flipped_frames.get((flip_x, flip_y))
+            if frames is None:
+                frames = [pygame.transform.flip(frame, self.flip_x != flip_x, self.flip_y != flip_y)
+                          for frame in anim.frames]
+                anim.flipped_frames[(flip_x, flip_y)] = frames
+            anim.frames = frames
+        
         self.flip_x = flip_x
         self.flip_y = flip_y
-        
-        # Recreate all animations with new flip state
-        if self.sprite_sheet and self.animations and self.resource_id:
-            current_anim = self.current_animation.name if self.current_animation else None
-            
-            # Store animation properties to recreate them
-            animations_to_recreate = []
-            for name, anim in self.animations.items():
-                # Find the original animation parameters
-                if hasattr(anim, 'original_params'):
-                    animations_to_recreate.append((name, anim.original_params, anim.frame_duration, anim.loop))
-                else:
-                    # Fallback for animations without original params
-                    frames = [pygame.transform.flip(frame, flip_x, flip_y) for frame in anim.frames]
-                    new_anim = Animation(name, frames, anim.frame_duration, anim.loop)
-                    self.animations[name] = new_anim
-            
-            # Clear animations that will be recreated
-            for name, _, _, _ in animations_to_recreate:
-                if name in self.animations:
-                    del self.animations[name]
-            
-            # Recreate animations with new flip state
-            for name, params, duration, loop in animations_to_recreate:
-                self.create_animation_from_lane(
-                    name=name,
-                    start_x=params['start_x'],
-                    start_y=params['start_y'],
-                    frame_width=params['frame_width'],
-                    frame_height=params['frame_height'],
-                    frame_count=params['frame_count'],
-                    frame_duration=duration,
-                    loop=loop,
-                    lane_width=params.get('lane_width')
-                )
-            
-            if current_anim and current_anim in self.animations:
-                self.play(current_anim)
     
     def update(self):
         """Update the animation state - called every frame"""
@@ -28,6 +28,12 @@ class TextureRenderer(Component):
         key = alias or path_or_key
         self.texture_key = key
         
+        # Caminho rápido: textura já no cache (evita o stat no disco a cada entidade)
+        texture = self.resource_manager.get_resource(key)
+        if texture:
+            self.texture = texture
+            return True
+        
         # Verifica se é um caminho ou uma chave
         if os.path.exists(path_or_key):
             # É um caminho, carrega usando ResourceManager
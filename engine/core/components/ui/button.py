@@ -86,7 +86,7 @@ class Button(UIElement):
         """Set click event handler"""
         self.on_click = handler
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
         """Render the button"""
         if not self.visible:
             return
@@ -0,0 +1,52 @@
+import pygame
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Fonts shared by every scene that asks for them, keyed by (name, size, system)
+_fonts: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+# Caches built from shared fonts, emptied together with them
+_clear_callbacks: List[Callable[[], None]] = []
+
+
+def get_font(size: int, name: Optional[str] = None, system: bool = False) -> pygame.font.Font:
+    """Get a shared font, opening it only on first use.
+
+    name is a font file (None for the default font), or a comma-separated list
+    of system font names when system is True. Fonts are shared, so callers must
+    not change their style (bold, italic, underline) in place.
+    """
+    key = (name, size, system)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size) if system else pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+@lru_cache(maxsize=256)
+def render_text(text: str, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+    """Render text in the default font, reusing the surface for repeated calls.
+
+    Static text (titles, instructions) is rasterized once and shared between
+    scenes and scene reloads, so the returned surface must not be drawn on.
+    """
+    return get_font(size).render(text, True, color)
+
+
+def on_fonts_cleared(callback: Callable[[], None]) -> None:
+    """Register a callback that empties a cache holding shared fonts or their renders"""
+    _clear_callbacks.append(callback)
+
+
+def clear_fonts() -> None:
+    """Drop every shared font and everything rendered from them.
+
+    Fonts are invalid once pygame.font is quit, so this runs before pygame.quit()
+    and must be called by anything that re-initializes pygame.font.
+    """
+    _fonts.clear()
+    render_text.cache_clear()
+    for callback in _clear_callbacks:
+        callback()
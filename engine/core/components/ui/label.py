@@ -1,32 +1,56 @@
 import pygame
 from typing import Tuple, Optional
 from .ui_element import UIElement
+from .font_registry import get_font, render_text
 
 class Label(UIElement):
     def __init__(self, x: int, y: int, text: str, font_size: int = 24):
-        # Initialize pygame font if not already initialized
-        if not pygame.font.get_init():
-            pygame.font.init()
-            
-        self.font = pygame.font.Font(None, font_size)
+        # Labels of the same size share one font (initializes pygame font if needed)
+        self.font = get_font(font_size)
+        self.font_size = font_size
         self.text = text
         self.text_color = (255, 255, 255)  # Default white
         self.padding = 5  # Padding around text
+        # Text given at construction is shared through render_text until it changes;
+        # changing text (stats, timers) is rendered per label so it can't evict it
+        self._static_text = True
         
         # Calculate size based on text
-        text_surface = self.font.render(text, True, self.text_color)
+        text_surface = self._render_text()
         width = text_surface.get_width() + (self.padding * 2)  # Add padding on both sides
         height = text_surface.get_height() + (self.padding * 2)
         
         super().__init__(x, y, width, height)
         
+        # Rendered text, reused until text, color or font change
+        self._text_surface = text_surface
+        self._text_key = (text, self.text_color, self.font)
+        
     def set_text(self, text: str):
         """Update the label's text"""
         self.text = text
+        self._static_text = False
         # Recalculate size
-        text_surface = self.font.render(text, True, self.text_color)
+        text_surface = self._render_text()
         self.width = text_surface.get_width() + (self.padding * 2)
         self.height = text_surface.get_height() + (self.padding * 2)
+        self._text_surface = text_surface
+        self._text_key = (text, self.text_color, self.font)
+        
+    def _render_text(self) -> pygame.Surface:
+        """Render the current text, sharing the surface for static text in the default font"""
+        if self._static_text and self.font is get_font(self.font_size):
+            return render_text(self.text, self.font_size, tuple(self.text_color))
+        return self.font.render(self.text, True, self.text_color)
+        
+    def clear(self):
+        """Empty the label without rendering anything"""
+        self.text = ""
+        self._static_text = False
+        self.width = self.padding * 2
+        self.height = self.font.get_height() + (self.padding * 2)
+        self._text_surface = None
+        self._text_key = ("", self.text_color, self.font)
         
     def set_text_color(self, color: Tuple[int, int, int]):
         """Set the text color"""
@@ -56,15 +80,21 @@ class Label(UIElement):
                            (abs_x, abs_y, self.width, self.height),
                            self.border_width)
         
-        # Then render the text
+        # Then render the text (text, color and font may also be assigned directly)
         try:
-            text_surface = self.font.render(self.text, True, self.text_color)
+            text_key = (self.text, self.text_color, self.font)
+            if text_key != self._text_key:
+                if self.text != self._text_key[0]:
+                    self._static_text = False
+                self._text_surface = self._render_text() if self.text else None
+                self._text_key = text_key
             
             # Position text with padding
             text_x = abs_x + self.padding
             text_y = abs_y + self.padding
             
-            screen.blit(text_surface, (text_x, text_y))
+            if self._text_surface is not None:
+                screen.blit(self._text_surface, (text_x, text_y))
         except pygame.error as e:
             print(f"Error rendering text: {e}")
             print(f"Text: {self.text}")
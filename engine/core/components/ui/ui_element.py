@@ -20,6 +20,7 @@ class UIElement:
         
         # Entity-like properties for scene compatibility
         self.active = True
+        self.needs_update = True
         self.scene = None
         self.components = {}
         self.id = id(self)  # Use Python's built-in id() for consistency with Entity
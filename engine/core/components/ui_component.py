@@ -57,6 +57,21 @@ class UIComponent(Component):
             # UI is always rendered in screen space, so ignore camera offset
             self.root.render(screen)
 
+    def is_fullscreen_opaque(self, screen_size: tuple) -> bool:
+        """True when a visible element with an opaque background covers the whole screen,
+        so nothing drawn underneath the UI can be seen"""
+        if not self.enabled or not self.root.visible:
+            return False
+        screen_width, screen_height = screen_size
+        for element in [self.root] + self.root.children:
+            color = element.background_color
+            if not element.visible or color is None or (len(color) == 4 and color[3] < 255):
+                continue
+            x, y = element.get_absolute_position()
+            if x <= 0 and y <= 0 and x + element.width >= screen_width and y + element.height >= screen_height:
+                return True
+        return False
+
     def create_menu(self, x: int, y: int, width: int, height: int,
                    buttons: list[tuple[str, callable]]) -> Panel:
         """
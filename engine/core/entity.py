@@ -18,6 +18,7 @@ class Entity:
         self.visible: bool = True
         self.scene: Optional['BaseScene'] = None  # Forward reference for type hint
         self.delta_time: float = 0.0  # Direct access to delta_time
+        self.needs_update: bool = True  # False once every component opts out of per-frame updates
         
         # Component system with thread safety
         self.components: Dict[Type[Component], Component] = {}
@@ -48,6 +49,7 @@ class Entity:
             
             self.components[component_type] = component
             component.attach(self)
+            self._refresh_needs_update()
             return component
 
     def get_component(self, component_type: Type[T]) -> Optional[T]:
@@ -74,6 +76,17 @@ class Entity:
             if component_type in self.components:
                 self.components[component_type].detach()
                 del self.components[component_type]
+                self._refresh_needs_update()
+
+    def _refresh_needs_update(self) -> None:
+        """Recompute needs_update; entity subclasses with their own update always need it."""
+        cls = type(self)
+        self.needs_update = (
+            cls.update is not Entity.update
+            or cls._perform_update is not Entity._perform_update
+            or not self.components
+            or any(component.needs_update for component in self.components.values())
+        )
 
     def has_component(self, component_type: Type[Component]) -> bool:
         """
@@ -155,7 +168,7 @@ class Entity:
         # Update all components (with component lock)
         with self._component_lock:
             # Create a copy of values to avoid modification during iteration
-            components = list(self.components.values())
+            components = tuple(self.components.values())
             
         # Update components outside the lock to avoid nested locking issues
         for component in components:
@@ -186,7 +199,7 @@ class Entity:
 
         # Get components safely
         with self._component_lock:
-            components = list(self.components.values())
+            components = tuple(self.components.values())
             
         # Render components outside the lock
         for component in components:
@@ -205,7 +218,7 @@ class Entity:
         """
         # Get components safely
         with self._component_lock:
-            components = list(self.components.values())
+            components = tuple(self.components.values())
             
         # Handle events outside the lock
         for component in components:
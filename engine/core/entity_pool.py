@@ -0,0 +1,52 @@
+from typing import Callable, List, Optional
+
+from .entity import Entity
+
+
+class EntityPool:
+    """Pre-allocated entities that are recycled instead of recreated.
+
+    release() only deactivates and hides an entity, leaving it in its scene
+    (scenes skip inactive entities in update, render and collisions), so spawning
+    bullets, particles, etc. repeatedly does not keep paying for Entity and
+    component construction or feeding the garbage collector.
+    """
+
+    def __init__(self, factory: Callable[[], Entity], initial: int = 1000,
+                 reset: Optional[Callable[[Entity], None]] = None):
+        self.factory = factory
+        self.reset = reset
+        self._free: List[Entity] = []
+        for _ in range(initial):
+            entity = factory()
+            entity.active = False
+            entity.visible = False
+            self._free.append(entity)
+        # acquire() pops from the end; hand entities out in creation order
+        self._free.reverse()
+
+    def acquire(self) -> Entity:
+        """Take an entity from the pool, creating a new one only if it is empty.
+
+        A recycled entity keeps the position, velocity and component state it
+        was released with; pass reset to restore whatever a new use relies on.
+        """
+        if self._free:
+            entity = self._free.pop()
+            if self.reset is not None:
+                self.reset(entity)
+        else:
+            entity = self.factory()
+        entity.active = True
+        entity.visible = True
+        return entity
+
+    def release(self, entity: Entity) -> None:
+        """Return an entity to the pool for reuse."""
+        entity.active = False
+        entity.visible = False
+        self._free.append(entity)
+
+    @property
+    def available(self) -> int:
+        return len(self._free)
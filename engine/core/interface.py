@@ -1,6 +1,7 @@
 import pygame
 from typing import Tuple, Optional, Union
 from .scenes.scene_manager import SceneManager
+from .components.ui.font_registry import clear_fonts
 
 class Interface:
     def __init__(self, 
@@ -26,6 +27,7 @@ class Interface:
         self.clock = pygame.time.Clock()
         self.running = True
         self.fps = 60
+        self._last_rendered_scene = None
         self.scene_manager = SceneManager()
         self.scene_manager.set_interface(self)  # Set interface reference in scene manager
         print("Interface initialized")
@@ -87,7 +89,17 @@ class Interface:
         self.screen.fill((0, 0, 0))  # Clear screen with black
         current_scene = self.scene_manager.get_current_scene()
         self.scene_manager.render(self.screen)
-        pygame.display.flip()
+        
+        # Scenes may report the screen regions that changed this frame (None means everything)
+        dirty_rects = None
+        if current_scene is self._last_rendered_scene and hasattr(current_scene, 'get_dirty_rects'):
+            dirty_rects = current_scene.get_dirty_rects()
+        self._last_rendered_scene = current_scene
+        
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
 
     def run(self):
         """Main game loop"""
@@ -105,6 +117,7 @@ class Interface:
         # Cleanup
         print("Cleaning up")
         self.scene_manager.cleanup()
+        clear_fonts()
         pygame.quit()
 
     def set_fps(self, fps: int):
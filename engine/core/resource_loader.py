@@ -1,4 +1,5 @@
 import pygame
+import io
 import os
 
 class ResourceLoader:
@@ -12,8 +13,12 @@ class ResourceLoader:
             print("ResourceLoader initialized")
         return cls._instance
     
-    def load_resource(self, path: str, resource_id: str = None) -> any:
-        """Load a resource and cache it. If resource_id is not provided, use path as id."""
+    def load_resource(self, path: str, resource_id: str = None, data: bytes = None) -> any:
+        """Load a resource and cache it. If resource_id is not provided, use path as id.
+        
+        If data is given (the file contents, e.g. read ahead on another thread) it is
+        decoded instead of reading path from disk; path still selects the resource type.
+        """
         if resource_id is None:
             resource_id = path
             
@@ -24,14 +29,15 @@ class ResourceLoader:
             return self._resources[resource_id]
             
         try:
-            if os.path.exists(path):
+            if data is not None or os.path.exists(path):
                 print(f"Loading resource: {path}")
+                source = io.BytesIO(data) if data is not None else path
                 if path.endswith('.png'):
-                    resource = pygame.image.load(path).convert_alpha()
+                    resource = pygame.image.load(source, path).convert_alpha()
                 elif path.endswith('.wav'):
-                    resource = pygame.mixer.Sound(path)
+                    resource = pygame.mixer.Sound(source)
                 elif path.endswith('.ogg') or path.endswith('.mp3'):
-                    resource = pygame.mixer.Sound(path)
+                    resource = pygame.mixer.Sound(source)
                 else:
                     print(f"Unknown resource type for {path}")
                     return None
@@ -19,10 +19,12 @@ class ResourceCache:
         self.max_memory = max_memory_mb * 1024 * 1024  # Convert to bytes
         self.current_memory = 0
         self.lock = threading.RLock()  # Reentrant lock for thread safety
+        self._stats: Optional[Dict[str, Any]] = None  # Rebuilt by get_stats after any change
     
     def add(self, key: str, resource: Any) -> None:
         """Add a resource to the cache."""
         with self.lock:
+            self._stats = None
             if key in self.resources:
                 self.reference_counts[key] += 1
             else:
@@ -60,6 +62,7 @@ class ResourceCache:
         """Add a transformed version of a resource to the cache."""
         with self.lock:
             if key in self.transformed_resources:
+                self._stats = None
                 self.transformed_resources[key][transform_key] = resource
                 
                 # Estimate and track the size of the transformed resource
@@ -73,6 +76,7 @@ class ResourceCache:
         """Remove a resource from the cache."""
         with self.lock:
             if key in self.resources:
+                self._stats = None
                 self.reference_counts[key] -= 1
                 
                 if self.reference_counts[key] <= 0:
@@ -99,6 +103,7 @@ class ResourceCache:
             self.resource_sizes.clear()
             self.transformed_resources.clear()
             self.current_memory = 0
+            self._stats = None
     
     def _manage_memory(self) -> None:
         """Free memory if we're over the limit."""
@@ -136,6 +141,9 @@ class ResourceCache:
     def _estimate_resource_size(self, resource: Any) -> int:
         """Estimate the memory size of a resource in bytes."""
         if isinstance(resource, pygame.Surface):
+            if resource.get_parent() is not None:
+                # Subsurface: its pixels belong to (and are counted for) the parent
+                return 0
             width, height = resource.get_size()
             if resource.get_bitsize() == 32:  # RGBA
                 bytes_per_pixel = 4
@@ -150,9 +158,11 @@ class ResourceCache:
             return 1024  # 1KB default
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about the cache."""
+        """Get statistics about the cache (the same dict is returned until the cache changes)."""
         with self.lock:
-            return {
+            if self._stats is not None:
+                return self._stats
+            self._stats = {
                 'total_resources': len(self.resources),
                 'memory_usage_mb': self.current_memory / (1024 * 1024),
                 'max_memory_mb': self.max_memory / (1024 * 1024),
@@ -166,6 +176,7 @@ class ResourceCache:
                     for key, res in self.resources.items()
                 }
             }
+            return self._stats
 
 
 class ResourceManager:
@@ -293,7 +304,7 @@ class ResourceManager:
             The transformed texture or None if the original texture is not found
         """
         # Generate a transform key
-        transform_key = f"s{scale}_f{flip}_r{rotation}_c{color}"
+        transform_key = self._transform_key(scale, flip, rotation, color)
         
         # Check if the transformed version is already cached
         transformed = self.cache.get_transformed(resource_id, transform_key)
@@ -327,6 +338,55 @@ class ResourceManager:
         
         return texture
     
+    @staticmethod
+    def _transform_key(scale=None, flip=None, rotation=None, color=None) -> str:
+        return f"s{scale}_f{flip}_r{rotation}_c{color}"
+    
+    def preload_batch(self, path: str, resource_ids: List[str],
+                      transforms: List[Dict[str, Any]] = None) -> List[pygame.Surface]:
+        """
+        Load one texture file under several resource IDs, reading and decoding it only once.
+        
+        Args:
+            path: Path to the texture file
+            resource_ids: IDs that will all refer to the loaded texture
+            transforms: Optional list with one dict of get_transformed_texture arguments
+                        per ID; IDs with the same transform share one transformed surface
+            
+        Returns:
+            The texture stored for each ID (empty if the file could not be loaded)
+        """
+        if not resource_ids:
+            return []
+            
+        # Reuse a copy that is already cached under any of the IDs
+        texture = None
+        for resource_id in resource_ids:
+            texture = self.cache.get(resource_id)
+            if texture:
+                break
+        else:
+            texture = self.load_texture(path, resource_ids[0])
+            if not texture:
+                return []
+        
+        shared_transforms: Dict[str, pygame.Surface] = {}
+        for i, resource_id in enumerate(resource_ids):
+            if self.cache.get(resource_id) is None:
+                self.cache.add(resource_id, texture)
+                
+            spec = transforms[i] if transforms else None
+            if not spec:
+                continue
+            transform_key = self._transform_key(**spec)
+            transformed = shared_transforms.get(transform_key)
+            if transformed is None:
+                shared_transforms[transform_key] = self.get_transformed_texture(resource_id, **spec)
+            elif self.cache.get_transformed(resource_id, transform_key) is None:
+                self.cache.add_transformed(resource_id, transform_key, transformed)
+                
+        return [texture] * len(resource_ids)
+    
     def extract_sprite_frames(self, resource_id: str, start_x: int, start_y: int, 
                              frame_width: int, frame_height: int, frame_count: int,
                              scale: Tuple[float, float] = None, flip: Tuple[bool, bool] = None,
@@ -348,13 +408,21 @@ class ResourceManager:
         Returns:
             List of extracted frame surfaces
         """
+        # The whole lane is cached too, so repeated requests are a single lookup
+        lane_id = (f"{resource_id}_lane_{start_x}_{start_y}_{frame_count}_{frame_width}_{frame_height}"
+                   f"_s{scale}_f{flip}_c{colorkey}")
+        lane = self.cache.get(lane_id)
+        if lane is not None:
+            return list(lane)
+        
         # Get the sprite sheet
         sprite_sheet = self.cache.get(resource_id)
         if not sprite_sheet:
             return []
             
         frames = []
-        sheet_width = sprite_sheet.get_width()
+        sheet_rect = sprite_sheet.get_rect()
+        sheet_width = sheet_rect.width
         
         for i in range(frame_count):
             x = start_x + (i * frame_width)
@@ -367,11 +435,16 @@ class ResourceManager:
             # Check if the frame is already cached
             frame = self.cache.get(frame_id)
             if not frame:
-                # Create frame surface
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.fill((0, 0, 0, 0))
-                # Extract frame from sprite sheet
-                frame.blit(sprite_sheet, (0, 0), (x, start_y, frame_width, frame_height))
+                frame_rect = pygame.Rect(x, start_y, frame_width, frame_height)
+                if sheet_rect.contains(frame_rect):
+                    # View into the sheet's pixels; frames share the sheet's memory
+                    frame = sprite_sheet.subsurface(frame_rect)
+                else:
+                    # Frame runs past the sheet: copy what there is onto a transparent surface
+                    # in the sheet's (already display-converted) pixel format
+                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA, sprite_sheet)
+                    frame.fill((0, 0, 0, 0))
+                    frame.blit(sprite_sheet, (0, 0), frame_rect)
                 
                 if colorkey:
                     frame.set_colorkey(colorkey)
@@ -400,8 +473,11 @@ class ResourceManager:
                 frames.append(transformed)
             else:
                 frames.append(frame)
+        
+        if frames:
+            self.cache.add(lane_id, frames)
                 
-        return frames
+        return list(frames)
     
     def preload_resource(self, path: str, resource_id: str = None, resource_type: str = None) -> None:
         """
@@ -425,12 +501,33 @@ class ResourceManager:
                 return
                 
         # Add to loading queue
-        self.loading_queue.put((path, resource_id, resource_type))
+        self.loading_queue.put(([(path, resource_id, resource_type)], None, None))
         
         # Start loading thread if not already running
         if not self.loading_active:
             self._start_loading_thread()
     
+    def preload_many(self, items: List[Tuple[str, str, str]], on_each_loaded: Callable = None,
+                     on_all_loaded: Callable = None) -> None:
+        """
+        Queue a batch of resources for asynchronous loading with a single queue operation.
+        
+        Args:
+            items: List of (path, resource_id, resource_type) tuples
+            on_each_loaded: Optional function called with each resource ID as it is loaded
+            on_all_loaded: Optional function called once after the whole batch is loaded
+        """
+        if not items:
+            if on_all_loaded:
+                on_all_loaded()
+            return
+            
+        batch = [(path, resource_id or path, resource_type) for path, resource_id, resource_type in items]
+        self.loading_queue.put((batch, on_each_loaded, on_all_loaded))
+        
+        if not self.loading_active:
+            self._start_loading_thread()
+    
     def preload_group(self, group_id: str, paths: List[Tuple[str, str, str]]) -> None:
         """
         Preload a group of resources.
@@ -495,37 +592,16 @@ class ResourceManager:
         try:
             while self.loading_active:
                 try:
-                    # Get the next resource to load (with a timeout to allow checking if we should stop)
-                    path, resource_id, resource_type = self.loading_queue.get(timeout=0.1)
+                    # Get the next batch to load (with a timeout to allow checking if we should stop)
+                    batch, on_each_loaded, on_all_loaded = self.loading_queue.get(timeout=0.1)
                     
-                    # Skip if already loaded
-                    if self.cache.get(resource_id):
-                        self.loading_queue.task_done()
-                        continue
-                        
-                    # Load the resource
-                    if resource_type == 'texture':
-                        self.load_texture(path, resource_id)
-                    elif resource_type == 'sound':
-                        self.load_sound(path, resource_id)
-                        
-                    # Call callbacks for this resource
-                    if resource_id in self.loading_callbacks:
-                        for callback in self.loading_callbacks[resource_id]:
-                            callback(resource_id)
+                    for path, resource_id, resource_type in batch:
+                        self._load_queued_resource(path, resource_id, resource_type, loaded_resources)
+                        if on_each_loaded:
+                            on_each_loaded(resource_id)
+                    if on_all_loaded:
+                        on_all_loaded()
                             
-                    # Track loaded resources for group callbacks
-                    loaded_resources.add(resource_id)
-                    
-                    # Check if any groups are complete
-                    for group_id, resources in self.preload_groups.items():
-                        if resources.issubset(loaded_resources):
-                            # Call group callbacks
-                            group_resource_id = f"__group_{group_id}"
-                            if group_resource_id in self.loading_callbacks:
-                                for callback in self.loading_callbacks[group_resource_id]:
-                                    callback(group_id)
-                                    
                     self.loading_queue.task_done()
                     
                 except queue.Empty:
@@ -537,6 +613,32 @@ class ResourceManager:
             print(f"Error in loading thread: {e}")
             self.loading_active = False
     
+    def _load_queued_resource(self, path: str, resource_id: str, resource_type: str,
+                              loaded_resources: Set[str]) -> None:
+        """Load one queued resource (unless already cached) and run its callbacks."""
+        if not self.cache.get(resource_id):
+            if resource_type == 'texture':
+                self.load_texture(path, resource_id)
+            elif resource_type == 'sound':
+                self.load_sound(path, resource_id)
+                
+        # Call callbacks for this resource
+        if resource_id in self.loading_callbacks:
+            for callback in self.loading_callbacks[resource_id]:
+                callback(resource_id)
+                
+        # Track loaded resources for group callbacks
+        loaded_resources.add(resource_id)
+        
+        # Check if any groups are complete
+        for group_id, resources in self.preload_groups.items():
+            if resources.issubset(loaded_resources):
+                # Call group callbacks
+                group_resource_id = f"__group_{group_id}"
+                if group_resource_id in self.loading_callbacks:
+                    for callback in self.loading_callbacks[group_resource_id]:
+                        callback(group_id)
+    
     def clear_cache(self) -> None:
         """Clear all resources from the cache."""
         self.cache.clear()
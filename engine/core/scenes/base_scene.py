@@ -1,11 +1,16 @@
 import pygame
-from typing import List, Dict, Optional, Any, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, NamedTuple, Tuple
 from ..camera import Camera
 from ..resource_loader import ResourceLoader
 from .collision_system import CollisionSystem
 from ..components.collider import Collider
 from ..thread_pool import ThreadPool, get_global_thread_pool
 
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
 class CollisionConfig(NamedTuple):
     """Configuração do sistema de colisão"""
     enabled: bool = True
@@ -37,6 +42,11 @@ class BaseScene:
         self.resource_loader = ResourceLoader()  # Get the singleton instance
         self.delta_time: float = 0.0  # Initialize delta_time
         
+        # Files being read in the background by _load_resources_async: future -> (names, path)
+        self._resource_executor = None
+        self._pending_resources = None
+        self._resources_loaded = 0
+        
         # Thread configuration
         self._thread_config = thread_config or ThreadConfig()
         self._thread_pool = None
@@ -194,6 +204,25 @@ class BaseScene:
             # Set scene reference in entity
             entity.scene = self
 
+    def add_entities(self, entities, group: str = "default"):
+        """Add many entities to the scene and group in one pass"""
+        scene_ids = {id(entity) for entity in self.entities}
+        if group not in self.entity_groups:
+            self.entity_groups[group] = []
+        group_entities = self.entity_groups[group]
+        group_ids = {id(entity) for entity in group_entities}
+        
+        for entity in entities:
+            if id(entity) in scene_ids:  # Prevent duplicate entities
+                continue
+            scene_ids.add(id(entity))
+            self.entities.append(entity)
+            if id(entity) not in group_ids:
+                group_ids.add(id(entity))
+                group_entities.append(entity)
+            # Set scene reference in entity
+            entity.scene = self
+
     def remove_entity(self, entity, group: str = "default"):
         """Remove an entity from the scene and group"""
         if entity in self.entities:
@@ -203,6 +232,19 @@ class BaseScene:
         # Remove scene reference
         entity.scene = None
 
+    def remove_entities(self, entities, group: str = "default"):
+        """Remove many entities from the scene and group in one pass"""
+        removed_ids = {id(entity) for entity in entities}
+        if not removed_ids:
+            return
+        self.entities = [entity for entity in self.entities if id(entity) not in removed_ids]
+        if group in self.entity_groups:
+            self.entity_groups[group] = [entity for entity in self.entity_groups[group]
+                                         if id(entity) not in removed_ids]
+        # Remove scene reference
+        for entity in entities:
+            entity.scene = None
+
     def get_entities_by_group(self, group: str) -> List:
         """Get all entities in a specific group"""
         return self.entity_groups.get(group, [])
@@ -229,8 +271,13 @@ class BaseScene:
         if self.camera:
             self.camera.update()
 
-        # Update all active entities (with optional parallel processing)
-        active_entities = [entity for entity in self.entities if entity.active]
+        # Update all active entities (with optional parallel processing); entities whose
+        # components are all driven by scene-level systems have nothing to do here,
+        # unless they still have a velocity or acceleration to integrate
+        active_entities = [
+            entity for entity in self.entities
+            if entity.active and (entity.needs_update or entity.velocity or entity.acceleration)
+        ]
         
         if (self._thread_config.enabled and self._thread_pool and 
             len(active_entities) >= self._thread_config.min_entities_for_threading):
@@ -240,6 +287,8 @@ class BaseScene:
             # Use sequential processing for small entity counts or when threading is disabled
             self._update_entities_sequential(active_entities, delta_time)
             
+        self._update_collisions()
+            
     def _update_entities_parallel(self, entities: List, delta_time: float):
         """Update entities using parallel processing."""
         try:
@@ -258,6 +307,8 @@ class BaseScene:
             except Exception as e:
                 print(f"Error updating entity {entity.id}: {e}")
 
+    def _update_collisions(self):
+        """Run the collision system once per frame, after all entities have moved."""
         # Update collision system com configurações
         if self.collision_system and self._collision_config.enabled:
             self._collision_frame_counter += 1
@@ -272,14 +323,11 @@ class BaseScene:
                     if hasattr(e, 'get_component') and e.get_component(Collider) is not None
                 ]
                 
-                # Auto-otimização: usar força bruta para poucas entidades
-                if (len(entities_with_colliders) <= self._collision_config.max_entities_for_bruteforce and 
-                    self._collision_config.use_spatial_partitioning):
-                    self.collision_system.set_spatial_partitioning(False)
-                    self.collision_system.update(self.entities)
-                    self.collision_system.set_spatial_partitioning(True, self._collision_config.grid_cell_size)
+                # Auto-otimização: usar força bruta para poucas entidades (a grid é mantida)
+                if len(entities_with_colliders) <= self._collision_config.max_entities_for_bruteforce:
+                    self.collision_system.update(self.entities, use_grid=False)
                 else:
-                    self.collision_system.update(self.entities)
+                    self.collision_system.update(self.entities, self._thread_pool)
 
     def render(self, screen: pygame.Surface):
         """Render the scene"""
@@ -287,20 +335,25 @@ class BaseScene:
             self._render_loading_screen(screen)
             return
 
-        # Fill background with black
-        screen.fill((20, 20, 20))
+        self._render_world(screen)
+        self._render_ui_group(screen)
+
+    def _render_world(self, screen: pygame.Surface, background_color: Tuple[int, int, int] = (20, 20, 20)):
+        """Clear the screen and render the non-UI entities with the camera offset"""
+        # Fill background (near black by default)
+        screen.fill(background_color)
 
         # Get camera offset
         camera_offset = (0, 0)
         if self.camera:
             camera_offset = (-self.camera.position.x, -self.camera.position.y)
 
-        # First render non-UI entities with camera offset
         for entity in self.entities:
             if entity.visible and entity not in self.get_entities_by_group("ui"):
                 entity.render(screen, camera_offset)
 
-        # Then render UI entities without camera offset (in screen space)
+    def _render_ui_group(self, screen: pygame.Surface):
+        """Render UI entities without camera offset (in screen space), on top of the world"""
         for entity in self.get_entities_by_group("ui"):
             if entity.visible:
                 entity.render(screen, (0, 0))
@@ -325,12 +378,72 @@ class BaseScene:
             return self.resource_loader.get_resource(self._resources[name])
         return None
 
-    def add_resource(self, name: str, path: str) -> None:
+    def add_resource(self, name: str, path: str, data: bytes = None) -> None:
         """Add a resource to the scene using the resource loader"""
-        resource = self.resource_loader.load_resource(path, name)
+        # Already loaded for this scene (e.g. load_resources run again on re-entry):
+        # don't load it again or take another reference that cleanup never releases
+        if name in self._resources and self.resource_loader.get_resource(self._resources[name]) is not None:
+            return
+        resource = self.resource_loader.load_resource(path, name, data)
         if resource:
             self._resources[name] = name
 
+    def _load_resources_async(self, resources: Dict[str, str]) -> float:
+        """Load resources (name -> path) without blocking the frame
+        
+        The first call starts reading every file on worker threads; later calls
+        (one per frame, so the loading screen keeps drawing) decode whatever has
+        finished. Decoding stays on the main thread, which owns the display that
+        convert_alpha() needs. Names sharing a path are read and decoded once.
+        Returns the fraction of resources done, 1.0 once everything is loaded.
+        """
+        total_resources = len(resources)
+        
+        if self._pending_resources is None:
+            print("Loading scene resources...")
+            path_to_names = {}
+            for name, path in resources.items():
+                path_to_names.setdefault(path, []).append(name)
+            self._resource_executor = ThreadPoolExecutor(max_workers=4)
+            self._pending_resources = {
+                self._resource_executor.submit(_read_file, path): (names, path)
+                for path, names in path_to_names.items()
+            }
+            self._resources_loaded = 0
+        
+        for future in [f for f in self._pending_resources if f.done()]:
+            names, path = self._pending_resources.pop(future)
+            name = names[0]
+            try:
+                print(f"Loading resource: {path}")
+                self.add_resource(name, path, future.result())
+                if name in self._resources:
+                    # The remaining names share the decoded resource (bumping its reference count)
+                    for alias in names[1:]:
+                        self.resource_loader.load_resource(path, self._resources[name])
+                        self._resources[alias] = self._resources[name]
+                    self._resources_loaded += len(names)
+                    print(f"Successfully loaded: {path}")
+            except Exception as e:
+                print(f"Failed to load resource {', '.join(names)}: {e}")
+        
+        if self._pending_resources:
+            done = total_resources - sum(len(names) for names, _ in self._pending_resources.values())
+            return done / total_resources
+        
+        self._resource_executor.shutdown()
+        self._resource_executor = None
+        self._pending_resources = None
+        print(f"Loaded {self._resources_loaded}/{total_resources} resources")
+        return 1.0
+    
+    def _cancel_resource_loading(self):
+        """Stop reading files started by _load_resources_async"""
+        if self._resource_executor:
+            self._resource_executor.shutdown(cancel_futures=True)
+            self._resource_executor = None
+            self._pending_resources = None
+
     def remove_resource(self, name: str) -> None:
         """Remove a resource from the scene"""
         if name in self._resources:
@@ -344,7 +457,8 @@ class BaseScene:
             self.remove_entity(entity)
         self.entity_groups.clear()
         
-        # Clear resources
+        # Clear resources (including any still being read)
+        self._cancel_resource_loading()
         for name in list(self._resources.keys()):
             self.remove_resource(name)
         self._resources.clear()
@@ -1,45 +1,108 @@
+from operator import itemgetter
 from typing import Set, Tuple, List, Dict, Optional
-from ..components.collider import Collider
+from ..components.collider import Collider, PolygonCollider
 from ..components.physics import Physics
 from ..entity import Entity
+from ..thread_pool import ThreadPool
+
+def get_collider_bounds(collider: Collider) -> Tuple[float, float, float, float]:
+    """Retorna a AABB (min_x, min_y, max_x, max_y) do collider em coordenadas do mundo"""
+    if isinstance(collider, PolygonCollider):
+        points = collider.get_world_points()
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        return (min(xs), min(ys), max(xs), max(ys))
+    
+    # Retângulos e círculos são centrados na entidade (mais o offset)
+    center_x = collider.entity.position.x + collider.offset.x
+    center_y = collider.entity.position.y + collider.offset.y
+    half_w = collider.width / 2
+    half_h = collider.height / 2
+    return (center_x - half_w, center_y - half_h, center_x + half_w, center_y + half_h)
 
 class SpatialGrid:
-    """Grid espacial para otimizar detecção de colisões"""
+    """Grid espacial para otimizar detecção de colisões
+    
+    Colliders estáticos (física kinematic) ficam numa grid separada que só é
+    reconstruída quando algum deles se move ou muda de tamanho; os dinâmicos
+    são redistribuídos a cada frame. Os pares estático-estático são calculados
+    junto com a reconstrução e reaproveitados até a próxima.
+    """
     def __init__(self, cell_size: float = 100.0):
         self.cell_size = cell_size
         self.grid: Dict[Tuple[int, int], List[Entity]] = {}
+        self.static_grid: Dict[Tuple[int, int], List[Entity]] = {}
+        self._static_bounds: Dict[int, Tuple[float, float, float, float]] = {}
+        self.static_pairs: List[Tuple[Entity, Entity]] = []
     
     def clear(self):
+        """Limpa as entidades dinâmicas (a grid estática é mantida)"""
         self.grid.clear()
     
+    def clear_static(self):
+        self.static_grid.clear()
+        self._static_bounds.clear()
+        self.static_pairs = []
+    
     def _get_cell_coords(self, x: float, y: float) -> Tuple[int, int]:
         return (int(x // self.cell_size), int(y // self.cell_size))
     
-    def insert(self, entity: Entity, collider: Collider):
-        """Insere uma entidade na grid baseado na posição do collider"""
-        # Assumindo que o collider tem posição x, y
-        cell = self._get_cell_coords(collider.x, collider.y)
-        if cell not in self.grid:
-            self.grid[cell] = []
-        self.grid[cell].append(entity)
+    def _get_cells(self, collider: Collider) -> List[Tuple[int, int]]:
+        """Todas as células cobertas pela AABB do collider"""
+        min_x, min_y, max_x, max_y = get_collider_bounds(collider)
+        cell_x0, cell_y0 = self._get_cell_coords(min_x, min_y)
+        cell_x1, cell_y1 = self._get_cell_coords(max_x, max_y)
+        return [(cx, cy) for cx in range(cell_x0, cell_x1 + 1) for cy in range(cell_y0, cell_y1 + 1)]
+    
+    def insert(self, entity: Entity, collider: Collider, static: bool = False):
+        """Insere uma entidade em todas as células que sua AABB ocupa"""
+        grid = self.static_grid if static else self.grid
+        for cell in self._get_cells(collider):
+            if cell not in grid:
+                grid[cell] = []
+            grid[cell].append(entity)
+    
+    def sync_static(self, static_entities: List[Entity], colliders: Dict[int, Collider]) -> bool:
+        """Reconstrói a grid estática só se o conjunto ou a AABB dos estáticos mudou"""
+        bounds = {entity.id: get_collider_bounds(colliders[entity.id]) for entity in static_entities}
+        if bounds == self._static_bounds:
+            return False
+        
+        self.static_grid.clear()
+        for entity in static_entities:
+            self.insert(entity, colliders[entity.id], static=True)
+        self._static_bounds = bounds
+        
+        # Pares estático-estático (triggers kinematic sobre corpos kinematic, etc.)
+        seen = set()
+        self.static_pairs = []
+        for cell_entities in self.static_grid.values():
+            for i, entity in enumerate(cell_entities):
+                for other_entity in cell_entities[i + 1:]:
+                    pair_key = (entity.id, other_entity.id) if entity.id < other_entity.id else (other_entity.id, entity.id)
+                    if pair_key not in seen:
+                        seen.add(pair_key)
+                        self.static_pairs.append((entity, other_entity))
+        return True
     
     def get_nearby_entities(self, entity: Entity, collider: Collider) -> List[Entity]:
-        """Retorna entidades próximas (mesma célula e células adjacentes)"""
+        """Retorna entidades (dinâmicas e estáticas) que compartilham alguma célula"""
         nearby = []
-        center_cell = self._get_cell_coords(collider.x, collider.y)
+        seen = {entity.id}
         
-        # Verifica célula atual e adjacentes (3x3)
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                cell = (center_cell[0] + dx, center_cell[1] + dy)
-                if cell in self.grid:
-                    for other_entity in self.grid[cell]:
-                        if other_entity != entity:
-                            nearby.append(other_entity)
+        for cell in self._get_cells(collider):
+            for grid in (self.grid, self.static_grid):
+                for other_entity in grid.get(cell, ()):
+                    if other_entity.id not in seen:
+                        seen.add(other_entity.id)
+                        nearby.append(other_entity)
         
         return nearby
 
 class CollisionSystem:
+    # Abaixo disso o custo de despachar para as threads supera o da consulta
+    PARALLEL_QUERY_MIN_ENTITIES = 256
+    
     def __init__(self, use_spatial_partitioning: bool = True, grid_cell_size: float = 100.0):
         self._collision_pairs: Set[Tuple[int, int]] = set()
         self._entity_cache: Dict[int, Entity] = {}
@@ -91,6 +154,10 @@ class CollisionSystem:
             # Skip UI entities usando cache
             if entity_id in self._ui_entity_ids:
                 continue
+            # Entidades inativas (ex.: devolvidas a um EntityPool) não colidem; seguem
+            # no cache para que on_collision_exit ainda seja disparado
+            if not entity.active:
+                continue
             result.append(entity)
         
         return result
@@ -115,41 +182,89 @@ class CollisionSystem:
         if physics2 and not physics2.is_kinematic:
             physics2.resolve_collision(collider1)
     
-    def _broad_phase_collision_detection(self, entities_with_colliders: List[Entity]) -> List[Tuple[Entity, Entity]]:
+    def _broad_phase_collision_detection(self, entities_with_colliders: List[Entity],
+                                         thread_pool: Optional[ThreadPool] = None,
+                                         use_grid: bool = True) -> List[Tuple[Entity, Entity]]:
         """Fase ampla de detecção usando spatial partitioning ou força bruta otimizada"""
         potential_pairs = []
         
-        if self.use_spatial_partitioning and self.spatial_grid:
-            # Usar spatial grid
-            self.spatial_grid.clear()
-            
-            # Inserir todas as entidades na grid
+        if use_grid and self.use_spatial_partitioning and self.spatial_grid:
+            # Estáticos entram na grid uma única vez; só os dinâmicos são redistribuídos
+            static_entities = []
+            dynamic_entities = []
             for entity in entities_with_colliders:
-                collider = self._collider_cache[entity.id]
-                self.spatial_grid.insert(entity, collider)
+                physics = self._physics_cache.get(entity.id)
+                if physics and physics.is_kinematic:
+                    static_entities.append(entity)
+                else:
+                    dynamic_entities.append(entity)
             
-            # Verificar colisões apenas entre entidades próximas
-            checked_pairs = set()
-            for entity in entities_with_colliders:
-                collider = self._collider_cache[entity.id]
-                nearby_entities = self.spatial_grid.get_nearby_entities(entity, collider)
-                
-                for other_entity in nearby_entities:
-                    # Evitar pares duplicados
-                    pair_key = tuple(sorted([entity.id, other_entity.id]))
-                    if pair_key not in checked_pairs:
-                        potential_pairs.append((entity, other_entity))
-                        checked_pairs.add(pair_key)
+            self.spatial_grid.sync_static(static_entities, self._collider_cache)
+            self.spatial_grid.clear()
+            for entity in dynamic_entities:
+                self.spatial_grid.insert(entity, self._collider_cache[entity.id])
+            
+            # Pares estático-estático vêm prontos da grid; só os dinâmicos consultam.
+            # A grid é só lida daqui em diante, então as consultas podem ser divididas entre threads
+            static_ids = {entity.id for entity in static_entities}
+            if thread_pool is not None and len(dynamic_entities) >= self.PARALLEL_QUERY_MIN_ENTITIES:
+                chunk_size = -(-len(dynamic_entities) // thread_pool.max_workers)
+                chunks = [dynamic_entities[i:i + chunk_size] for i in range(0, len(dynamic_entities), chunk_size)]
+                for chunk_pairs in thread_pool.executor.map(self._query_nearby_pairs, chunks, [static_ids] * len(chunks)):
+                    potential_pairs.extend(chunk_pairs)
+            else:
+                potential_pairs = self._query_nearby_pairs(dynamic_entities, static_ids)
+            potential_pairs.extend(self.spatial_grid.static_pairs)
         else:
-            # Força bruta otimizada (como antes, mas usando cache)
-            for i in range(len(entities_with_colliders)):
-                for j in range(i + 1, len(entities_with_colliders)):
-                    potential_pairs.append((entities_with_colliders[i], entities_with_colliders[j]))
+            potential_pairs = self._sweep_and_prune(entities_with_colliders)
+        
+        return potential_pairs
+    
+    def _query_nearby_pairs(self, entities: List[Entity], static_ids: Set[int]) -> List[Tuple[Entity, Entity]]:
+        """Consulta a grid para um lote de entidades dinâmicas (somente leitura, seguro entre threads)
+        
+        Um par dinâmico-dinâmico é encontrado pelas duas entidades; só a de menor id o registra,
+        então os lotes não precisam compartilhar um conjunto de pares já vistos.
+        """
+        pairs = []
+        get_nearby_entities = self.spatial_grid.get_nearby_entities
+        for entity in entities:
+            collider = self._collider_cache[entity.id]
+            for other_entity in get_nearby_entities(entity, collider):
+                if entity.id < other_entity.id or other_entity.id in static_ids:
+                    pairs.append((entity, other_entity))
+        return pairs
+    
+    def _sweep_and_prune(self, entities_with_colliders: List[Entity]) -> List[Tuple[Entity, Entity]]:
+        """Fase ampla por AABB: ordena as caixas no eixo x e só gera pares que se sobrepõem"""
+        boxes = []
+        for entity in entities_with_colliders:
+            min_x, min_y, max_x, max_y = get_collider_bounds(self._collider_cache[entity.id])
+            boxes.append((min_x, max_x, min_y, max_y, entity))
+        boxes.sort(key=itemgetter(0))
+        
+        potential_pairs = []
+        active = []
+        for box in boxes:
+            min_x, _, min_y, max_y, entity = box
+            # Caixas que terminam antes desta começar não sobrepõem mais nenhuma seguinte
+            active = [other for other in active if other[1] >= min_x]
+            for other in active:
+                if other[2] <= max_y and min_y <= other[3]:
+                    potential_pairs.append((other[4], entity))
+            active.append(box)
         
         return potential_pairs
     
-    def update(self, entities: List[Entity]):
-        """Update collision detection and resolution (versão otimizada)"""
+    def update(self, entities: List[Entity], thread_pool: Optional[ThreadPool] = None,
+               use_grid: bool = True):
+        """Update collision detection and resolution (versão otimizada)
+        
+        Com um thread_pool, as consultas da fase ampla rodam em paralelo; a fase
+        estreita (que altera posições e dispara callbacks) continua serial.
+        Com use_grid=False este frame usa sweep and prune, sem descartar a grid
+        (nem os estáticos já distribuídos nela).
+        """
         self._current_frame += 1
         
         # Atualizar caches
@@ -167,7 +282,7 @@ class CollisionSystem:
             return  # Early return se não há pares suficientes
         
         # Broad phase: encontrar pares potenciais
-        potential_pairs = self._broad_phase_collision_detection(entities_with_colliders)
+        potential_pairs = self._broad_phase_collision_detection(entities_with_colliders, thread_pool, use_grid)
         
         # Narrow phase: verificação precisa de colisão
         for entity1, entity2 in potential_pairs:
@@ -219,11 +334,14 @@ class CollisionSystem:
         self._ui_entity_ids.clear()
         if self.spatial_grid:
             self.spatial_grid.clear()
+            self.spatial_grid.clear_static()
     
     def set_spatial_partitioning(self, enabled: bool, cell_size: float = 100.0):
         """Enable/disable spatial partitioning"""
         self.use_spatial_partitioning = enabled
         if enabled:
-            self.spatial_grid = SpatialGrid(cell_size)
+            # Keep the existing grid (and its static buckets) when the cell size is unchanged
+            if not self.spatial_grid or self.spatial_grid.cell_size != cell_size:
+                self.spatial_grid = SpatialGrid(cell_size)
         else:
             self.spatial_grid = None
\ No newline at end of file
@@ -1,7 +1,19 @@
+import asyncio
 import socket
 import threading
 import json
 
+
+class _ServerProtocol(asyncio.DatagramProtocol):
+    """Feeds datagrams received by the event loop into the server."""
+
+    def __init__(self, server: 'DedicatedServer'):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr: tuple):
+        self.server._handle_packet(data.decode('utf-8'), addr)
+
+
 class DedicatedServer:
     """Simple UDP-based server for syncing player actions."""
 
@@ -13,6 +25,7 @@ class DedicatedServer:
         self.clients = {}
         self.running = False
         self.thread = None
+        self._transport = None
 
     def start(self):
         """Start listening for client packets."""
@@ -28,13 +41,39 @@ class DedicatedServer:
             self.thread.join(timeout=0.1)
         self.sock.close()
 
+    async def serve(self, shutdown_event: asyncio.Event):
+        """Serve on the running event loop until shutdown_event is set.
+
+        Alternative to start()/stop(): packets are dispatched by the loop's
+        selector instead of a dedicated receive thread.
+        """
+        loop = asyncio.get_running_loop()
+        self.sock.bind((self.host, self.port))
+        self.sock.setblocking(False)
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _ServerProtocol(self), sock=self.sock
+        )
+        self.running = True
+        try:
+            await shutdown_event.wait()
+        finally:
+            self.running = False
+            self._transport.close()
+            self._transport = None
+
+    def _send(self, data: bytes, addr: tuple):
+        if self._transport is not None:
+            self._transport.sendto(data, addr)
+        else:
+            self.sock.sendto(data, addr)
+
     def broadcast(self, message: dict, exclude: str | None = None):
         """Send a message to all connected clients except the excluded one."""
         data = json.dumps(message).encode('utf-8')
         for pid, info in list(self.clients.items()):
             if pid == exclude:
                 continue
-            self.sock.sendto(data, info["addr"])
+            self._send(data, info["addr"])
 
     def _handle_packet(self, data: str, addr: tuple):
         try:
@@ -50,7 +89,7 @@ class DedicatedServer:
             for other_pid, info in self.clients.items():
                 if other_pid == pid:
                     continue
-                self.sock.sendto(
+                self._send(
                     json.dumps({"cmd": "join", "player": other_pid, "host": info.get("host")}).encode("utf-8"),
                     addr,
                 )
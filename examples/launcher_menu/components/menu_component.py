@@ -129,6 +129,11 @@ class ExampleCard(Component):
         self.hover_scale = 1.0
         self.glow_alpha = 0
         
+        # Cached render surfaces
+        self._card_surface: Optional[pygame.Surface] = None
+        self._card_key = None
+        self._glow_surface: Optional[pygame.Surface] = None
+        
         # Fonts
         pygame.font.init()
         self.title_font = pygame.font.Font(None, 28)
@@ -180,36 +185,58 @@ class ExampleCard(Component):
             y <= mouse_pos[1] <= y + self.height
         )
         
-    def render(self, screen: pygame.Surface, camera_offset=(0, 0)):
-        if not self.entity:
-            return
-            
+    def get_blits(self, offset_y: float = 0) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the (surface, position) pairs that draw this card, shifted up by offset_y."""
         # Calculate scaled dimensions
         scale = self.hover_scale
         scaled_width = int(self.width * scale)
         scaled_height = int(self.height * scale)
         
         x = int(self.entity.position.x - scaled_width // 2)
-        y = int(self.entity.position.y - scaled_height // 2)
+        y = int(self.entity.position.y - offset_y - scaled_height // 2)
+        
+        blits = []
+        
+        # Glow effect
+        glow_alpha = int(self.glow_alpha)
+        if glow_alpha > 0:
+            glow_size = (scaled_width + 20, scaled_height + 20)
+            if self._glow_surface is None or self._glow_surface.get_size() != glow_size:
+                self._glow_surface = pygame.Surface(glow_size).convert()
+                self._glow_surface.fill((100, 150, 255))
+            self._glow_surface.set_alpha(glow_alpha)
+            blits.append((self._glow_surface, (x - 10, y - 10)))
+            
+        # Card body, re-rendered only when its size or hover state changes
+        card_key = (scaled_width, scaled_height, self.is_hovered)
+        if self._card_key != card_key:
+            self._card_surface = self._render_card(scaled_width, scaled_height)
+            self._card_key = card_key
+        blits.append((self._card_surface, (x, y)))
+        
+        return blits
         
-        card_rect = pygame.Rect(x, y, scaled_width, scaled_height)
+    def render(self, screen: pygame.Surface, camera_offset=(0, 0)):
+        if not self.entity:
+            return
+            
+        screen.blits(self.get_blits(), False)
         
-        # Draw glow effect
-        if self.glow_alpha > 0:
-            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20))
-            glow_surface.set_alpha(int(self.glow_alpha))
-            glow_surface.fill((100, 150, 255))
-            screen.blit(glow_surface, (x - 10, y - 10))
+    def _render_card(self, width: int, height: int) -> pygame.Surface:
+        """Render the card body (background, border and content) to its own surface."""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        card_rect = surface.get_rect()
         
         # Draw card background
-        pygame.draw.rect(screen, self.bg_color, card_rect, border_radius=12)
+        pygame.draw.rect(surface, self.bg_color, card_rect, border_radius=12)
         
         # Draw border
         border_color = (150, 150, 200) if self.is_hovered else self.border_color
-        pygame.draw.rect(screen, border_color, card_rect, 2, border_radius=12)
+        pygame.draw.rect(surface, border_color, card_rect, 2, border_radius=12)
         
         # Draw content
-        self._draw_content(screen, card_rect)
+        self._draw_content(surface, card_rect)
+        return surface.convert_alpha()
         
     def _draw_content(self, screen: pygame.Surface, rect: pygame.Rect):
         """Draw card content."""
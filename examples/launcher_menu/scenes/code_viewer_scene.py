@@ -3,16 +3,125 @@ Code Viewer Scene - Displays source code of examples
 """
 
 import pygame
+import functools
+import mmap
+import numpy as np
 import os
+import re
+import threading
 from pathlib import Path
-from typing import List, Optional
-from engine import BaseScene, Entity, Component
+from typing import Dict, List, Optional, Sequence, Tuple
+from engine import BaseScene, Entity, Component, get_font, on_fonts_cleared
 from components.menu_component import MenuButton
 
+# Token kinds, in the same order as the groups of _TOKEN_RE
+TOKEN_KINDS = ('ws', 'comment', 'string', 'number', 'ident', 'newline', 'other')
+_WS, _IDENT, _NEWLINE = (TOKEN_KINDS.index(kind) for kind in ('ws', 'ident', 'newline'))
+
+# Byte-level scanner; bytes >= 0x80 are treated as identifier characters so
+# multi-byte UTF-8 sequences are never split across tokens
+_TOKEN_RE = re.compile(
+    rb'(?P<ws>[ \t]+)'
+    rb'|(?P<comment>#[^\r\n]*)'
+    rb'|(?P<string>"(?:\\[^\r\n]|[^"\\\r\n])*"?|\'(?:\\[^\r\n]|[^\'\\\r\n])*\'?)'
+    rb'|(?P<number>\d+(?:\.\d+)*)'
+    rb'|(?P<ident>[A-Za-z_\x80-\xff][\w\x80-\xff]*)'
+    rb'|(?P<newline>\r?\n)'
+    rb'|(?P<other>.)'
+)
+
+def tokenize(buffer) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Scan a whole source buffer in one pass of the C regex engine.
+    
+    Returns parallel (start, length, kind) arrays; newline tokens are dropped.
+    """
+    spans = np.array(
+        [(m.start(), m.end() - m.start(), m.lastindex - 1) for m in _TOKEN_RE.finditer(buffer)],
+        dtype=np.int64
+    ).reshape(-1, 3)
+    spans = spans[spans[:, 2] != _NEWLINE]
+    return spans[:, 0], spans[:, 1], spans[:, 2].astype(np.uint8)
+
+@functools.lru_cache(maxsize=4096)
+def _render_glyph(font: pygame.font.Font, raw: bytes, color: Tuple[int, int, int],
+                  background: Tuple[int, int, int]) -> pygame.Surface:
+    """Render a token; shared by every CodeDisplay using the same font.
+    
+    Glyphs are drawn onto the known opaque background, so blitting them is a
+    plain copy instead of a per-pixel alpha blend.
+    """
+    text = raw.decode('utf-8', errors='replace').expandtabs(4)
+    # Convert once to the display format so every later blit skips pixel conversion
+    return font.render(text, True, color, background).convert()
+
+# Glyphs hold on to their fonts, so they go when the shared fonts are cleared
+on_fonts_cleared(_render_glyph.cache_clear)
+
+class SourceLines(Sequence):
+    """Read-only view of a text buffer's lines, tokenized once and decoded on access."""
+    
+    def __init__(self, data=b''):
+        self._data = data
+        size = len(data)
+        
+        # Index line boundaries in one vectorized pass instead of str.split
+        newlines = np.flatnonzero(np.frombuffer(self._data, dtype=np.uint8) == 0x0A)
+        self._starts = np.concatenate(([0], newlines + 1))
+        self._ends = np.concatenate((newlines, [size]))
+        
+        # Token spans stored as parallel arrays (structure of arrays)
+        self.token_start, self.token_len, self.token_kind = tokenize(self._data)
+        # Index of the first token of every line (plus an end sentinel)
+        self._line_tokens = np.searchsorted(self.token_start, np.append(self._starts, size + 1))
+        
+    @classmethod
+    def from_file(cls, path) -> 'SourceLines':
+        """Memory-map a file instead of reading it into a Python string."""
+        with open(path, 'rb') as f:
+            # mmap cannot map empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls()
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            
+    @classmethod
+    def from_text(cls, text: str) -> 'SourceLines':
+        return cls(text.encode('utf-8'))
+        
+    def __len__(self) -> int:
+        return len(self._starts)
+        
+    def __getitem__(self, index: int) -> str:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        raw = self._data[self._starts[index]:self._ends[index]]
+        return raw.decode('utf-8', errors='replace').rstrip('\r').expandtabs(4)
+        
+    @property
+    def data(self):
+        """The raw UTF-8 buffer that token offsets index into."""
+        return self._data
+        
+    def token_range(self, index: int) -> Tuple[int, int]:
+        """Return the [first, last) token indices of a line."""
+        return int(self._line_tokens[index]), int(self._line_tokens[index + 1])
+        
+    def close(self):
+        """Release the underlying memory map."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+            
 class CodeDisplay(Component):
     """Component for displaying syntax-highlighted code."""
     
-    def __init__(self, width: int, height: int):
+    MONOSPACE_FONTS = 'consolas,menlo,dejavusansmono,couriernew,monospace'
+    
+    # Colors that tokens can take, addressed by a small palette index
+    PALETTE_KEYS = ('text', 'keyword', 'string', 'comment', 'number', 'function')
+    _TEXT, _KEYWORD, _STRING, _COMMENT, _NUMBER, _FUNCTION = range(len(PALETTE_KEYS))
+    # Palette index per token kind, in TOKEN_KINDS order; identifiers are refined per line
+    _KIND_COLORS = np.array([_TEXT, _COMMENT, _STRING, _NUMBER, _TEXT, _TEXT, _TEXT], dtype=np.uint8)
+    
+    def __init__(self, width: int, height: int, font: pygame.font.Font, small_font: pygame.font.Font):
         super().__init__()
         self.width = width
         self.height = height
@@ -21,10 +130,24 @@ class CodeDisplay(Component):
         self.scroll_speed = 300
         
         # Code content
-        self.lines: List[str] = []
+        self.lines = SourceLines()
+        self._token_colors = np.zeros(0, dtype=np.uint8)
+        self._resolved_lines = np.zeros(0, dtype=bool)
+        self._glyph_cache: Dict[Tuple[bytes, int], Tuple[pygame.Surface, int]] = {}
+        self._linenum_surfaces: Optional[List[pygame.Surface]] = None
+        self._panel_cache: Optional[pygame.Surface] = None
+        self._content_view: Optional[pygame.Surface] = None
+        self._dirty = True
+        # Scrollbar geometry, recomputed only when the scroll state changes
+        self._scrollbar_rect: Optional[pygame.Rect] = None
+        self._thumb_rect: Optional[pygame.Rect] = None
         self.line_height = 18
-        self.font = None
-        self.small_font = None
+        self.font = font
+        self.small_font = small_font
+        # Fixed advance when the font is monospace; SysFont falls back to a
+        # proportional font when no monospace face exists
+        char_w = font.size('M')[0]
+        self._char_w: Optional[int] = char_w if font.size('i')[0] == char_w else None
         
         # Syntax highlighting colors
         self.colors = {
@@ -47,10 +170,25 @@ class CodeDisplay(Component):
             'None', 'self', 'super', '__init__'
         }
         
+        # Glyphs are cached by palette index, so keys hash a small int instead of a color tuple
+        self._palette = [tuple(self.colors[key]) for key in self.PALETTE_KEYS]
+        
     def set_code(self, code_text: str):
         """Set the code content to display."""
-        self.lines = code_text.split('\n')
+        self.set_lines(SourceLines.from_text(code_text))
+        
+    def set_lines(self, lines: SourceLines):
+        """Set the code content from a pre-scanned source buffer."""
+        if self.lines is not lines:
+            self.lines.close()
+        self.lines = lines
+        # Keyword/function colors are resolved on first display and kept until the next set_lines
+        self._token_colors = self._KIND_COLORS[lines.token_kind]
+        self._resolved_lines = np.zeros(len(lines), dtype=bool)
+        self._linenum_surfaces = None  # Rebuilt on next render, once fonts exist
         self.scroll_y = 0
+        self._thumb_rect = None
+        self._dirty = True
         
         # Calculate max scroll
         visible_lines = (self.height - 40) // self.line_height
@@ -60,53 +198,69 @@ class CodeDisplay(Component):
         if not self.entity:
             return
             
-        # Initialize fonts if needed
-        if not self.font:
-            pygame.font.init()
-            self.font = pygame.font.Font(None, 16)
-            self.small_font = pygame.font.Font(None, 14)
-            
         # Handle scrolling
         keys = pygame.key.get_pressed()
-        dt = self.entity.delta_time
+        delta = 0
         
         if keys[pygame.K_UP]:
-            self.scroll_y = max(0, self.scroll_y - self.scroll_speed * dt)
+            delta = -self.scroll_speed * self.entity.delta_time
         elif keys[pygame.K_DOWN]:
-            self.scroll_y = min(self.max_scroll, self.scroll_y + self.scroll_speed * dt)
+            delta = self.scroll_speed * self.entity.delta_time
         elif keys[pygame.K_PAGEUP]:
-            self.scroll_y = max(0, self.scroll_y - self.height * 0.8)
+            delta = -self.height * 0.8
         elif keys[pygame.K_PAGEDOWN]:
-            self.scroll_y = min(self.max_scroll, self.scroll_y + self.height * 0.8)
+            delta = self.height * 0.8
         elif keys[pygame.K_HOME]:
-            self.scroll_y = 0
+            delta = -self.max_scroll
         elif keys[pygame.K_END]:
-            self.scroll_y = self.max_scroll
+            delta = self.max_scroll
+            
+        if delta:
+            self._scroll_to(self.scroll_y + delta)
+            
+    def _scroll_to(self, value: float):
+        """Clamp and apply a new scroll position, marking the panel dirty if it moved."""
+        value = 0 if value < 0 else self.max_scroll if value > self.max_scroll else value
+        if value != self.scroll_y:
+            self.scroll_y = value
+            self._thumb_rect = None
+            self._dirty = True
             
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.MOUSEWHEEL:
             # Mouse wheel scrolling
-            self.scroll_y = max(0, min(self.max_scroll, self.scroll_y - event.y * 40))
+            self._scroll_to(self.scroll_y - event.y * 40)
             
     def render(self, screen: pygame.Surface, camera_offset=(0, 0)):
-        if not self.entity or not self.font:
+        if not self.entity:
             return
             
-        x = int(self.entity.position.x)
-        y = int(self.entity.position.y)
+        # Only redraw the panel when its content or scroll position changed
+        if self._dirty or self._panel_cache is None:
+            self._render_panel()
+            self._dirty = False
+            
+        screen.blit(self._panel_cache, (int(self.entity.position.x), int(self.entity.position.y)))
+        
+    def _render_panel(self):
+        """Render the whole code panel into the offscreen cache."""
+        margin = 10
+        if self._panel_cache is None or self._panel_cache.get_size() != (self.width, self.height):
+            self._panel_cache = pygame.Surface((self.width, self.height)).convert()
+            # Drawing into a subsurface of the visible area clips for free,
+            # without toggling set_clip on every redraw
+            self._content_view = self._panel_cache.subsurface(
+                pygame.Rect(margin, margin, self.width - 2 * margin, self.height - 2 * margin))
+        screen = self._panel_cache
+        view = self._content_view
         
         # Draw background
-        background_rect = pygame.Rect(x, y, self.width, self.height)
+        background_rect = screen.get_rect()
         pygame.draw.rect(screen, self.colors['background'], background_rect)
         pygame.draw.rect(screen, (60, 60, 80), background_rect, 2)
         
-        # Calculate visible area
-        margin = 10
-        content_rect = pygame.Rect(x + margin, y + margin, 
-                                 self.width - 2 * margin, self.height - 2 * margin)
-        
-        # Set clipping region
-        screen.set_clip(content_rect)
+        # Visible area, in content-view coordinates
+        content_rect = view.get_rect()
         
         # Calculate visible lines
         start_line = max(0, int(self.scroll_y // self.line_height))
@@ -115,155 +269,125 @@ class CodeDisplay(Component):
         
         # Draw line numbers background
         line_num_width = 50
-        line_bg_rect = pygame.Rect(content_rect.x, content_rect.y, 
-                                  line_num_width, content_rect.height)
-        pygame.draw.rect(screen, (35, 35, 45), line_bg_rect)
-        pygame.draw.line(screen, (60, 60, 80), 
-                        (content_rect.x + line_num_width, content_rect.y),
-                        (content_rect.x + line_num_width, content_rect.y + content_rect.height))
+        line_bg_rect = pygame.Rect(0, 0, line_num_width, content_rect.height)
+        pygame.draw.rect(view, (35, 35, 45), line_bg_rect)
+        pygame.draw.line(view, (60, 60, 80), 
+                        (line_num_width, 0), (line_num_width, content_rect.height))
         
         # Draw code lines
+        line_numbers = self._get_line_number_surfaces()
         for line_idx in range(start_line, end_line):
-            line_y = content_rect.y + (line_idx * self.line_height) - self.scroll_y
+            line_y = (line_idx * self.line_height) - self.scroll_y
             
             if line_y > content_rect.bottom:
                 break
                 
             # Draw line number
-            line_num_text = str(line_idx + 1).rjust(3)
-            line_num_surface = self.small_font.render(line_num_text, True, self.colors['line_number'])
-            screen.blit(line_num_surface, (content_rect.x + 5, line_y))
+            view.blit(line_numbers[line_idx], (5, line_y))
             
             # Draw code line with syntax highlighting
             if line_idx < len(self.lines):
-                self._draw_highlighted_line(screen, self.lines[line_idx], 
-                                          content_rect.x + line_num_width + 10, line_y)
-        
-        # Remove clipping
-        screen.set_clip(None)
+                self._draw_highlighted_line(view, line_idx, line_num_width + 10, line_y,
+                                          content_rect.right)
         
         # Draw scrollbar
         self._draw_scrollbar(screen, background_rect)
         
-    def _draw_highlighted_line(self, screen: pygame.Surface, line: str, x: int, y: int):
-        """Draw a line with syntax highlighting."""
-        if not line.strip():
-            return
-            
-        current_x = x
-        i = 0
-        
-        while i < len(line):
-            char = line[i]
-            
-            # Skip leading whitespace
-            if char == ' ' or char == '\t':
-                space_surface = self.font.render(char, True, self.colors['text'])
-                screen.blit(space_surface, (current_x, y))
-                current_x += space_surface.get_width()
-                i += 1
-                continue
+    def _get_line_number_surfaces(self) -> List[pygame.Surface]:
+        """Return the gutter surfaces, rendering them once per loaded file."""
+        if self._linenum_surfaces is None:
+            color = self.colors['line_number']
+            self._linenum_surfaces = [
+                self.small_font.render(str(i + 1).rjust(3), True, color).convert_alpha()
+                for i in range(len(self.lines))
+            ]
+        return self._linenum_surfaces
+        
+    def warm_glyph_cache(self):
+        """Pre-render printable ASCII and keywords so the first scroll does not hitch."""
+        for code in range(0x20, 0x7F):
+            self._glyph(bytes((code,)), self._TEXT)
+        for keyword in self.keywords:
+            self._glyph(keyword.encode('utf-8'), self._KEYWORD)
             
-            # Comments
-            if char == '#':
-                comment_text = line[i:]
-                comment_surface = self.font.render(comment_text, True, self.colors['comment'])
-                screen.blit(comment_surface, (current_x, y))
-                break
-                
-            # Strings
-            elif char in ['"', "'"]:
-                quote = char
-                string_start = i
-                i += 1
-                while i < len(line) and line[i] != quote:
-                    if line[i] == '\\' and i + 1 < len(line):
-                        i += 2  # Skip escaped character
-                    else:
-                        i += 1
-                if i < len(line):
-                    i += 1  # Include closing quote
-                    
-                string_text = line[string_start:i]
-                string_surface = self.font.render(string_text, True, self.colors['string'])
-                screen.blit(string_surface, (current_x, y))
-                current_x += string_surface.get_width()
-                continue
-                
-            # Numbers
-            elif char.isdigit():
-                num_start = i
-                while i < len(line) and (line[i].isdigit() or line[i] == '.'):
-                    i += 1
-                    
-                num_text = line[num_start:i]
-                num_surface = self.font.render(num_text, True, self.colors['number'])
-                screen.blit(num_surface, (current_x, y))
-                current_x += num_surface.get_width()
-                continue
-                
-            # Keywords and identifiers
-            elif char.isalpha() or char == '_':
-                word_start = i
-                while i < len(line) and (line[i].isalnum() or line[i] == '_'):
-                    i += 1
-                    
-                word = line[word_start:i]
-                color = self.colors['keyword'] if word in self.keywords else self.colors['text']
-                
-                # Check for function definitions
-                if word == 'def' and i < len(line):
-                    # Highlight function name
-                    word_surface = self.font.render(word, True, color)
-                    screen.blit(word_surface, (current_x, y))
-                    current_x += word_surface.get_width()
-                    
-                    # Find function name
-                    while i < len(line) and line[i] == ' ':
-                        space_surface = self.font.render(' ', True, self.colors['text'])
-                        screen.blit(space_surface, (current_x, y))
-                        current_x += space_surface.get_width()
-                        i += 1
-                        
-                    if i < len(line) and (line[i].isalpha() or line[i] == '_'):
-                        func_start = i
-                        while i < len(line) and (line[i].isalnum() or line[i] == '_'):
-                            i += 1
-                        func_name = line[func_start:i]
-                        func_surface = self.font.render(func_name, True, self.colors['function'])
-                        screen.blit(func_surface, (current_x, y))
-                        current_x += func_surface.get_width()
-                    continue
-                else:
-                    word_surface = self.font.render(word, True, color)
-                    screen.blit(word_surface, (current_x, y))
-                    current_x += word_surface.get_width()
-                continue
+    def _resolve_line_colors(self, first: int, last: int):
+        """Refine identifier colors of one line into keyword/function colors."""
+        data = self.lines.data
+        colors = self._token_colors
+        expect_function_name = False
+        
+        for k, start, length, kind in zip(range(first, last),
+                                          self.lines.token_start[first:last].tolist(),
+                                          self.lines.token_len[first:last].tolist(),
+                                          self.lines.token_kind[first:last].tolist()):
+            if kind == _IDENT:
+                text = data[start:start + length].decode('utf-8', errors='replace')
+                if expect_function_name:
+                    colors[k] = self._FUNCTION
+                elif text in self.keywords:
+                    colors[k] = self._KEYWORD
+                # Highlight the name that follows a 'def'
+                expect_function_name = text == 'def'
+            elif kind != _WS:
+                expect_function_name = False
                 
-            # Other characters
+    def _glyph(self, raw: bytes, color_idx: int) -> Tuple[pygame.Surface, int]:
+        """Return a rendered token and its advance, caching both by (raw text, palette index)."""
+        key = (raw, color_idx)
+        entry = self._glyph_cache.get(key)
+        if entry is None:
+            # Misses fall through to the process-wide cache, so new viewers start warm
+            surface = _render_glyph(self.font, raw, self._palette[color_idx],
+                                    self.colors['background'])
+            if self._char_w:
+                advance = self._char_w * len(raw.decode('utf-8', errors='replace').expandtabs(4))
             else:
-                char_surface = self.font.render(char, True, self.colors['text'])
-                screen.blit(char_surface, (current_x, y))
-                current_x += char_surface.get_width()
-                i += 1
+                advance = surface.get_width()
+            entry = self._glyph_cache[key] = (surface, advance)
+        return entry
+        
+    def _draw_highlighted_line(self, screen: pygame.Surface, line_idx: int, x: int, y: int,
+                               right: int):
+        """Draw a line with syntax highlighting, stopping at the right edge."""
+        first, last = self.lines.token_range(line_idx)
+        if not self._resolved_lines[line_idx]:
+            self._resolve_line_colors(first, last)
+            self._resolved_lines[line_idx] = True
+            
+        data = self.lines.data
+        current_x = x
+        for start, length, color_idx in zip(self.lines.token_start[first:last].tolist(),
+                                            self.lines.token_len[first:last].tolist(),
+                                            self._token_colors[first:last].tolist()):
+            # Everything past the clip edge would be discarded anyway
+            if current_x >= right:
+                break
+            surface, advance = self._glyph(data[start:start + length], color_idx)
+            screen.blit(surface, (current_x, y))
+            current_x += advance
                 
     def _draw_scrollbar(self, screen: pygame.Surface, rect: pygame.Rect):
         """Draw scrollbar indicator."""
         if self.max_scroll <= 0:
             return
             
+        if self._thumb_rect is None:
+            self._update_scrollbar_geometry(rect)
+            
+        # Scrollbar background and thumb
+        pygame.draw.rect(screen, (40, 40, 50), self._scrollbar_rect)
+        pygame.draw.rect(screen, (100, 100, 120), self._thumb_rect)
+        
+    def _update_scrollbar_geometry(self, rect: pygame.Rect):
+        """Recompute the scrollbar track and thumb; only needed when the scroll state changes."""
         scrollbar_width = 10
         scrollbar_x = rect.right - scrollbar_width - 5
-        scrollbar_rect = pygame.Rect(scrollbar_x, rect.y + 5, scrollbar_width, rect.height - 10)
-        
-        # Scrollbar background
-        pygame.draw.rect(screen, (40, 40, 50), scrollbar_rect)
+        self._scrollbar_rect = pygame.Rect(scrollbar_x, rect.y + 5, scrollbar_width, rect.height - 10)
         
-        # Scrollbar thumb
-        thumb_height = max(20, int((rect.height / (self.max_scroll + rect.height)) * scrollbar_rect.height))
-        thumb_y = scrollbar_rect.y + int((self.scroll_y / self.max_scroll) * (scrollbar_rect.height - thumb_height))
-        thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
-        pygame.draw.rect(screen, (100, 100, 120), thumb_rect)
+        track_height = self._scrollbar_rect.height
+        thumb_height = max(20, track_height * rect.height // (self.max_scroll + rect.height))
+        thumb_y = self._scrollbar_rect.y + int(self.scroll_y * (track_height - thumb_height) / self.max_scroll)
+        self._thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
 
 class CodeViewerScene(BaseScene):
     """Scene for viewing example source code."""
@@ -274,56 +398,75 @@ class CodeViewerScene(BaseScene):
         self.launcher = launcher
         self.font = None
         self.title_font = None
+        self.code_font = None
+        self.line_number_font = None
         
         # File browser state
         self.current_file = None
         self.project_files: List[str] = []
+        self._files_discovered = False  # Set once the background discovery finishes
         self.selected_file_index = 0
+        self._file_surfaces: List[Tuple[pygame.Surface, pygame.Surface]] = []
+        self._file_surfaces_source: Optional[List[str]] = None
         
     def on_initialize(self):
         """Initialize the code viewer scene."""
         pygame.font.init()
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 32)
+        self.code_font = get_font(14, CodeDisplay.MONOSPACE_FONTS, system=True)
+        self.line_number_font = get_font(14)
         
-        # Discover project files
-        self._discover_project_files()
+        # Discover project files in the background; the first one is loaded in update()
+        threading.Thread(target=self._discover_project_files, daemon=True).start()
         
         # Create UI elements
         self._create_ui_elements()
-        
-        # Load initial file
-        if self.project_files:
-            self._load_file(self.project_files[0])
             
     def _discover_project_files(self):
-        """Discover all Python files in the example project."""
+        """Discover all Python files in the example project (runs on a worker thread)."""
+        try:
+            self._find_project_files()
+        finally:
+            # Even if discovery failed, the sidebar stops waiting for files
+            self._files_discovered = True
+            
+    def _find_project_files(self):
+        """Collect the example's Python and README files into project_files."""
         example_path = self.launcher.base_path / self.example_info.file_path
         project_dir = example_path.parent
         
-        self.project_files = []
+        files = []
         
         # Add main file first
         if example_path.exists():
-            self.project_files.append(str(example_path.relative_to(project_dir)))
+            files.append(example_path.name)
             
         # Discover other Python files
-        for root, dirs, files in os.walk(project_dir):
-            # Skip hidden directories and __pycache__
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-            
-            for file in files:
-                if file.endswith('.py') and file != example_path.name:
-                    rel_path = Path(root).relative_to(project_dir) / file
-                    self.project_files.append(str(rel_path))
-                    
+        pending = [project_dir]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip hidden directories and __pycache__
+                            if not entry.name.startswith('.') and entry.name != '__pycache__':
+                                pending.append(entry.path)
+                        elif entry.name.endswith('.py') and entry.name != example_path.name:
+                            files.append(str(Path(entry.path).relative_to(project_dir)))
+            except OSError:
+                continue
+                
         # Also include README files
         for file in ['README.md', 'README.txt', 'readme.md']:
             readme_path = project_dir / file
             if readme_path.exists():
-                self.project_files.append(file)
+                files.append(file)
                 
-        self.project_files.sort()
+        files.sort()
+        # Publish the finished list in a single assignment
+        self.project_files = files
         
     def _create_ui_elements(self):
         """Create UI elements for the code viewer."""
@@ -355,8 +498,10 @@ class CodeViewerScene(BaseScene):
         
         # Code display
         code_display = Entity(600, 300)
-        self.code_component = CodeDisplay(width=1000, height=500)
+        self.code_component = CodeDisplay(width=1000, height=500,
+                                          font=self.code_font, small_font=self.line_number_font)
         code_display.add_component(self.code_component)
+        self.code_component.warm_glyph_cache()
         self.add_entity(code_display, "ui")
         
     def _load_file(self, file_path: str):
@@ -368,10 +513,7 @@ class CodeViewerScene(BaseScene):
             project_dir = example_path.parent
             full_path = project_dir / file_path
             
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            self.code_component.set_code(content)
+            self.code_component.set_lines(SourceLines.from_file(full_path))
             
         except Exception as e:
             error_content = f"Error loading file: {file_path}\n\n{str(e)}"
@@ -398,6 +540,13 @@ class CodeViewerScene(BaseScene):
         """Update the code viewer scene."""
         super().update(delta_time)
         
+        # Report examples that have finished running
+        self.launcher.poll_processes()
+        
+        # Load initial file once discovery has finished
+        if self.current_file is None and self.project_files:
+            self._load_file(self.project_files[0])
+        
     def render(self, screen: pygame.Surface):
         """Render the code viewer scene."""
         # Dark background
@@ -436,22 +585,42 @@ class CodeViewerScene(BaseScene):
         
         # Files list
         y_offset = sidebar_rect.y + 10
-        for i, file_path in enumerate(self.project_files):
+        if not self.project_files:
+            status = "No files" if self._files_discovered else "Loading..."
+            loading_surface = self.font.render(status, True, (150, 150, 150))
+            screen.blit(loading_surface, (sidebar_rect.x + 5, y_offset))
+            return
+            
+        file_surfaces = self._get_file_surfaces()
+        blit_sequence = []
+        for file_path, (normal_surface, current_surface) in zip(self.project_files, file_surfaces):
             if y_offset > sidebar_rect.bottom - 20:
                 break
                 
-            color = (100, 150, 255) if file_path == self.current_file else (200, 200, 200)
-            
-            # Truncate long filenames
-            display_name = file_path
-            if len(display_name) > 18:
-                display_name = "..." + display_name[-15:]
-                
-            file_surface = self.font.render(display_name, True, color)
-            screen.blit(file_surface, (sidebar_rect.x + 5, y_offset))
+            surface = current_surface if file_path == self.current_file else normal_surface
+            blit_sequence.append((surface, (sidebar_rect.x + 5, y_offset)))
             
             y_offset += 25
             
+        screen.blits(blit_sequence, False)
+        
+    def _get_file_surfaces(self) -> List[Tuple[pygame.Surface, pygame.Surface]]:
+        """Return (normal, current) name surfaces per project file, rendered once per file list."""
+        if self._file_surfaces_source is not self.project_files:
+            self._file_surfaces = []
+            for file_path in self.project_files:
+                # Truncate long filenames
+                display_name = file_path
+                if len(display_name) > 18:
+                    display_name = "..." + display_name[-15:]
+                    
+                self._file_surfaces.append((
+                    self.font.render(display_name, True, (200, 200, 200)),
+                    self.font.render(display_name, True, (100, 150, 255))
+                ))
+            self._file_surfaces_source = self.project_files
+        return self._file_surfaces
+        
     def _render_instructions(self, screen: pygame.Surface):
         """Render instructions."""
         instructions = [
@@ -4,73 +4,72 @@ Main Menu Scene for PyEngine Examples Launcher
 
 import pygame
 import math
-import random
-from engine import BaseScene, Entity, Component
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from engine import BaseScene, Entity
 from utils.example_launcher import ExampleLauncher, ExampleInfo
 from components.menu_component import MenuButton, ExampleCard, ScrollableContainer
 
-class BackgroundParticle(Component):
-    """Animated background particle for visual appeal."""
+# Particle alpha is rounded down to multiples of this when picking a cached sprite
+ALPHA_STEP = 16
+
+class BackgroundParticles:
+    """Animated background particles for visual appeal, stored as parallel arrays."""
     
-    def __init__(self):
-        super().__init__()
-        self.speed = random.uniform(10, 30)
-        self.direction = random.uniform(0, 2 * math.pi)
-        self.size = random.uniform(1, 3)
-        self.alpha = random.uniform(50, 150)
-        self.color = random.choice([
-            (100, 150, 255),
-            (150, 100, 255),
-            (255, 150, 100),
-            (100, 255, 150)
-        ])
-        self.pulse_speed = random.uniform(1, 3)
-        self.pulse_timer = 0
-        
-    def update(self):
-        if not self.entity:
-            return
-            
-        dt = self.entity.delta_time
-        
-        # Move particle
-        self.entity.position.x += math.cos(self.direction) * self.speed * dt
-        self.entity.position.y += math.sin(self.direction) * self.speed * dt
-        
-        # Wrap around screen
-        if self.entity.position.x < 0:
-            self.entity.position.x = 1200
-        elif self.entity.position.x > 1200:
-            self.entity.position.x = 0
-            
-        if self.entity.position.y < 0:
-            self.entity.position.y = 800
-        elif self.entity.position.y > 800:
-            self.entity.position.y = 0
-            
-        # Update pulse
-        self.pulse_timer += dt * self.pulse_speed
-        
-    def render(self, screen: pygame.Surface, camera_offset=(0, 0)):
-        if not self.entity:
-            return
-            
+    COLORS = [
+        (100, 150, 255),
+        (150, 100, 255),
+        (255, 150, 100),
+        (100, 255, 150)
+    ]
+    
+    # Pre-drawn circles shared by all particles, keyed by (radius, color index, alpha)
+    _sprite_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+    
+    def __init__(self, count: int, width: int, height: int):
+        self.bounds = np.array([width, height], dtype=np.float32)
+        self.positions = np.random.uniform(0, 1, (count, 2)).astype(np.float32) * self.bounds
+        
+        # Direction never changes, so velocities are computed once
+        speed = np.random.uniform(10, 30, count)
+        direction = np.random.uniform(0, 2 * math.pi, count)
+        self.velocities = np.stack([np.cos(direction) * speed, np.sin(direction) * speed], axis=1).astype(np.float32)
+        
+        self.sizes = np.random.uniform(1, 3, count)
+        self.alphas = np.random.uniform(50, 150, count)
+        self.color_indices = np.random.randint(0, len(self.COLORS), count)
+        self.pulse_speeds = np.random.uniform(1, 3, count)
+        self.pulse_timers = np.zeros(count)
+        
+    def update(self, dt: float):
+        """Move every particle, wrapping around the screen, and advance the pulses."""
+        self.positions += self.velocities * dt
+        np.mod(self.positions, self.bounds, out=self.positions)
+        self.pulse_timers += self.pulse_speeds * dt
+        
+    def get_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return the (sprite, position) pairs to draw all particles this frame."""
         # Apply pulse effect
-        pulse = 1.0 + 0.3 * math.sin(self.pulse_timer)
-        current_size = max(1, int(self.size * pulse))
-        
-        # Apply alpha
-        color_with_alpha = (*self.color, int(self.alpha * pulse))
-        
-        # Create surface for alpha blending
-        particle_surface = pygame.Surface((current_size * 2, current_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surface, color_with_alpha, (current_size, current_size), current_size)
-        
-        pos = (
-            int(self.entity.position.x - current_size),
-            int(self.entity.position.y - current_size)
-        )
-        screen.blit(particle_surface, pos)
+        pulse = 1.0 + 0.3 * np.sin(self.pulse_timers)
+        sizes = np.maximum(1, (self.sizes * pulse).astype(np.int32))
+        
+        # Apply alpha, quantized so particles share a handful of sprites
+        alphas = (self.alphas * pulse).astype(np.int32) // ALPHA_STEP * ALPHA_STEP
+        
+        corners = (self.positions - sizes[:, None]).astype(np.int32)
+        
+        blits = []
+        for size, color_index, alpha, (x, y) in zip(sizes.tolist(), self.color_indices.tolist(),
+                                                     alphas.tolist(), corners.tolist()):
+            key = (size, color_index, alpha)
+            sprite = self._sprite_cache.get(key)
+            if sprite is None:
+                sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (*self.COLORS[color_index], alpha), (size, size), size)
+                sprite = sprite.convert_alpha()
+                self._sprite_cache[key] = sprite
+            blits.append((sprite, (x, y)))
+        return blits
 
 class MainMenuScene(BaseScene):
     """Main menu scene for launching PyEngine examples."""
@@ -93,6 +92,27 @@ class MainMenuScene(BaseScene):
         self.subtitle_font = None
         self.info_font = None
         
+        self.particles = None
+        
+        # Cached static background and title surfaces
+        self._background = None
+        self._title_base = None
+        self._title_scaled = None
+        self._subtitle_surface = None
+        self._sidebar_title = None
+        self._stats_surfaces: List[pygame.Surface] = []
+        self._instruction_surfaces: List[pygame.Surface] = []
+        
+        # Dirty rect tracking for partial display updates
+        self._dirty: List[pygame.Rect] = []
+        self._full_redraw = True
+        self._last_scroll = None
+        self._title_area = None
+        self._particle_rects: List[pygame.Rect] = []
+        
+        # Category buttons, kept alive so selection only recolors them
+        self._category_buttons: Dict[str, MenuButton] = {}
+        
         # Layout
         self.sidebar_width = 250
         self.content_width = 950
@@ -109,6 +129,9 @@ class MainMenuScene(BaseScene):
         self.subtitle_font = pygame.font.Font(None, 32)
         self.info_font = pygame.font.Font(None, 24)
         
+        # Pre-render the static gradient background
+        self._background = self._create_background_gradient(1200, 800)
+        
         # Create background particles
         self._create_background_particles()
         
@@ -116,20 +139,49 @@ class MainMenuScene(BaseScene):
         self._create_sidebar()
         self._create_example_cards()
         
+        # The example catalog is fixed, so its stats are rendered once
+        self._stats_surfaces = self._render_stats_surfaces()
+        
+        instructions = [
+            "Click on example cards to launch them",
+            "Use categories to filter examples",
+            "Scroll with mouse wheel or arrow keys",
+            "ESC to exit launcher"
+        ]
+        self._instruction_surfaces = [
+            self.info_font.render(instruction, True, (150, 150, 150)).convert_alpha()
+            for instruction in instructions
+        ]
+        
         # Create title entity
         self._create_title()
         
+        # Title text never changes; only its pulse scale does
+        self._title_base = self.title_font.render(
+            "PyEngine Examples Launcher", True, (255, 255, 255)).convert_alpha()
+        self._subtitle_surface = self.subtitle_font.render(
+            "Explore and launch PyEngine demos", True, (200, 200, 200)).convert_alpha()
+        self._sidebar_title = self.subtitle_font.render("Categories", True, (255, 255, 255)).convert_alpha()
+        
+        # Area covered by the title at its largest pulse
+        self._title_area = pygame.Rect(0, 0, int(self._title_base.get_width() * 1.1) + 2,
+                                       int(self._title_base.get_height() * 1.1) + 2)
+        self._title_area.center = (600, 80)
+        
         print("✓ Launcher menu initialized")
         
+    def _create_background_gradient(self, width: int, height: int) -> pygame.Surface:
+        """Build the vertical dark gradient once as a display-format surface."""
+        color_values = (20 + (np.arange(height) / height) * 15).astype(np.uint8)
+        pixels = np.empty((width, height, 3), dtype=np.uint8)
+        pixels[:, :, 0] = color_values
+        pixels[:, :, 1] = color_values
+        pixels[:, :, 2] = color_values + 5
+        return pygame.surfarray.make_surface(pixels).convert()
+        
     def _create_background_particles(self):
         """Create animated background particles."""
-        for i in range(30):
-            particle = Entity(
-                random.uniform(0, 1200),
-                random.uniform(0, 800)
-            )
-            particle.add_component(BackgroundParticle())
-            self.add_entity(particle, "background")
+        self.particles = BackgroundParticles(30, 1200, 800)
             
     def _create_title(self):
         """Create the main title entity."""
@@ -157,6 +209,7 @@ class MainMenuScene(BaseScene):
             )
             button_entity.add_component(button)
             self.add_entity(button_entity, "ui")
+            self._category_buttons[category] = button
             
         # Add stats info
         stats = self.launcher.get_example_stats()
@@ -167,7 +220,7 @@ class MainMenuScene(BaseScene):
     def _create_example_cards(self):
         """Create example cards based on current category."""
         # Clear existing cards
-        for entity in self.get_entities_by_group("cards"):
+        for entity in list(self.get_entities_by_group("cards")):
             self.remove_entity(entity, "cards")
             
         # Get examples for current category
@@ -194,8 +247,9 @@ class MainMenuScene(BaseScene):
             card = ExampleCard(example, card_width, card_height)
             card_entity.add_component(card)
             
-            # Store example info for launching
+            # Store example info and hit box (in unscrolled coordinates) for launching
             card_entity.example_info = example
+            card_entity.card_rect = pygame.Rect(x, y, card_width, card_height)
             
             self.add_entity(card_entity, "cards")
             
@@ -203,14 +257,22 @@ class MainMenuScene(BaseScene):
         """Select a category and refresh cards."""
         if category != self.current_category:
             print(f"Selected category: {category}")
+            self._category_buttons[self.current_category].color = (60, 60, 80)
+            self._category_buttons[category].color = (100, 149, 237)
             self.current_category = category
+            self._full_redraw = True
             self._create_example_cards()
-            self._create_sidebar()  # Refresh sidebar to update selected button
             
     def update(self, delta_time: float):
         """Update the menu scene."""
         super().update(delta_time)
         
+        # Report examples that have finished running
+        self.launcher.poll_processes()
+        
+        # Update all background particles in one vectorized step
+        self.particles.update(delta_time)
+        
         # Update title pulse
         self.title_pulse += delta_time * 2
         
@@ -220,15 +282,11 @@ class MainMenuScene(BaseScene):
     def render(self, screen: pygame.Surface):
         """Render the menu scene."""
         # Dark gradient background
-        for i in range(800):
-            color_value = int(20 + (i / 800) * 15)
-            color = (color_value, color_value, color_value + 5)
-            pygame.draw.line(screen, color, (0, i), (1200, i))
+        screen.blit(self._background, (0, 0))
             
-        # Render background particles first
-        for entity in self.get_entities_by_group("background"):
-            if entity.visible:
-                entity.render(screen)
+        # Render background particles first, as a single batched blit
+        particle_blits = self.particles.get_blits()
+        screen.blits(particle_blits, False)
                 
         # Draw sidebar background
         sidebar_rect = pygame.Rect(0, 0, self.sidebar_width, 800)
@@ -241,14 +299,14 @@ class MainMenuScene(BaseScene):
         # Render sidebar content
         self._render_sidebar_content(screen)
         
-        # Render cards with scroll offset
+        # Render cards with scroll offset, as a single batched blit
+        card_blits = []
         for entity in self.get_entities_by_group("cards"):
-            if entity.visible:
-                # Apply scroll offset
-                original_y = entity.position.y
-                entity.position.y -= self.scroll_offset
-                entity.render(screen)
-                entity.position.y = original_y  # Restore position
+            if entity.visible and self._is_card_on_screen(entity):
+                card = entity.get_component(ExampleCard)
+                if card:
+                    card_blits.extend(card.get_blits(self.scroll_offset))
+        screen.blits(card_blits, False)
                 
         # Render UI elements
         for entity in self.get_entities_by_group("ui"):
@@ -258,72 +316,107 @@ class MainMenuScene(BaseScene):
         # Render instructions
         self._render_instructions(screen)
         
+        self._collect_dirty_rects(particle_blits)
+        
+    def _collect_dirty_rects(self, particle_blits: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+        """Record the screen regions that changed since the previous frame."""
+        # Scrolling moves every card, so the whole screen has to be presented
+        scroll = int(self.scroll_offset)
+        if scroll != self._last_scroll:
+            self._last_scroll = scroll
+            self._full_redraw = True
+            
+        particle_rects = [sprite.get_rect(topleft=pos) for sprite, pos in particle_blits]
+        
+        # Particles need both their old and new positions refreshed
+        self._dirty = self._particle_rects + particle_rects
+        self._particle_rects = particle_rects
+        self._dirty.append(self._title_area)
+        
+        # Cards and buttons that are hovered or still animating back
+        for entity in self.get_entities_by_group("cards"):
+            card = entity.get_component(ExampleCard)
+            if card and (card.is_hovered or int(card.glow_alpha) > 0 or abs(card.hover_scale - 1.0) > 0.001):
+                card_area = entity.card_rect.move(0, -scroll)
+                self._dirty.append(card_area.inflate(card_area.width // 10 + 22, card_area.height // 10 + 22))
+                
+        for entity in self.get_entities_by_group("ui"):
+            button = entity.get_component(MenuButton)
+            if button and (button.is_hovered or abs(button.hover_scale - 1.0) > 0.001):
+                button_area = pygame.Rect(0, 0, int(button.width * 1.1) + 2, int(button.height * 1.1) + 2)
+                button_area.center = (int(entity.position.x), int(entity.position.y))
+                self._dirty.append(button_area)
+                
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Regions to pass to pygame.display.update, or None to flip the whole screen."""
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        return self._dirty
+        
+    def _is_card_on_screen(self, entity: Entity) -> bool:
+        """Check whether a card overlaps the visible card area at the current scroll offset."""
+        ey = entity.position.y - self.scroll_offset
+        return not (ey + 90 < 150 or ey - 90 > 800)
+        
     def _render_title(self, screen: pygame.Surface):
         """Render the main title with effects."""
         # Main title with pulse effect
         pulse = 1.0 + 0.1 * math.sin(self.title_pulse)
         
-        title_text = "PyEngine Examples Launcher"
-        title_surface = self.title_font.render(title_text, True, (255, 255, 255))
-        
-        # Scale with pulse
-        scaled_width = int(title_surface.get_width() * pulse)
-        scaled_height = int(title_surface.get_height() * pulse)
-        title_surface = pygame.transform.scale(title_surface, (scaled_width, scaled_height))
-        
-        title_rect = title_surface.get_rect(center=(600, 80))
-        screen.blit(title_surface, title_rect)
+        # Re-scale only when the pulsed width moved by a couple of pixels
+        scaled_width = int(self._title_base.get_width() * pulse)
+        if self._title_scaled is None or abs(scaled_width - self._title_scaled.get_width()) >= 2:
+            scaled_height = int(self._title_base.get_height() * pulse)
+            self._title_scaled = pygame.transform.scale(self._title_base, (scaled_width, scaled_height))
+            
+        title_rect = self._title_scaled.get_rect(center=(600, 80))
+        screen.blit(self._title_scaled, title_rect)
         
         # Subtitle
-        subtitle_text = "Explore and launch PyEngine demos"
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, (200, 200, 200))
-        subtitle_rect = subtitle_surface.get_rect(center=(600, 120))
-        screen.blit(subtitle_surface, subtitle_rect)
+        subtitle_rect = self._subtitle_surface.get_rect(center=(600, 120))
+        screen.blit(self._subtitle_surface, subtitle_rect)
         
     def _render_sidebar_content(self, screen: pygame.Surface):
         """Render sidebar content."""
         # Sidebar title
-        sidebar_title = self.subtitle_font.render("Categories", True, (255, 255, 255))
-        screen.blit(sidebar_title, (20, 20))
+        screen.blit(self._sidebar_title, (20, 20))
         
         # Stats
         if hasattr(self, 'stats_entity'):
-            stats = self.launcher.get_example_stats()
-            stats_lines = [
-                f"Total Examples: {stats['total']}",
-                f"Categories: {stats['categories']}",
-                f"Beginner: {stats['beginner']}",
-                f"Intermediate: {stats['intermediate']}",
-                f"Advanced: {stats['advanced']}",
-                f"Threading Demos: {stats['threading_demos']}"
-            ]
-            
             y_offset = self.stats_entity.position.y - 50
-            for line in stats_lines:
-                text_surface = self.info_font.render(line, True, (180, 180, 180))
-                screen.blit(text_surface, (20, y_offset))
-                y_offset += 25
+            screen.blits([(text_surface, (20, y_offset + i * 25))
+                          for i, text_surface in enumerate(self._stats_surfaces)], False)
                 
-    def _render_instructions(self, screen: pygame.Surface):
-        """Render instructions at the bottom."""
-        instructions = [
-            "Click on example cards to launch them",
-            "Use categories to filter examples",
-            "Scroll with mouse wheel or arrow keys",
-            "ESC to exit launcher"
+    def _render_stats_surfaces(self) -> List[pygame.Surface]:
+        """Render the example statistics lines shown in the sidebar."""
+        stats = self.launcher.get_example_stats()
+        stats_lines = [
+            f"Total Examples: {stats['total']}",
+            f"Categories: {stats['categories']}",
+            f"Beginner: {stats['beginner']}",
+            f"Intermediate: {stats['intermediate']}",
+            f"Advanced: {stats['advanced']}",
+            f"Threading Demos: {stats['threading_demos']}"
         ]
+        return [self.info_font.render(line, True, (180, 180, 180)).convert_alpha() for line in stats_lines]
         
+    def _render_instructions(self, screen: pygame.Surface):
+        """Render instructions at the bottom."""
         y_start = 720
-        for i, instruction in enumerate(instructions):
-            text_surface = self.info_font.render(instruction, True, (150, 150, 150))
-            screen.blit(text_surface, (self.sidebar_width + 20, y_start + i * 20))
+        screen.blits([(text_surface, (self.sidebar_width + 20, y_start + i * 20))
+                      for i, text_surface in enumerate(self._instruction_surfaces)], False)
             
     def handle_event(self, event: pygame.event.Event):
         """Handle menu events."""
         super().handle_event(event)
         
+        # Window contents were lost, present the whole screen again
+        if event.type == pygame.VIDEOEXPOSE:
+            self._full_redraw = True
+            
         # Handle scrolling
-        if event.type == pygame.MOUSEWHEEL:
+        elif event.type == pygame.MOUSEWHEEL:
             self.scroll_target = max(0, self.scroll_target - event.y * 30)
             
         elif event.type == pygame.KEYDOWN:
@@ -344,9 +437,12 @@ class MainMenuScene(BaseScene):
                 
     def _handle_card_click(self, mouse_pos):
         """Handle clicking on example cards."""
+        # Cards are laid out in unscrolled coordinates
+        content_pos = (mouse_pos[0], mouse_pos[1] + self.scroll_offset)
         for entity in self.get_entities_by_group("cards"):
-            card_component = entity.get_component(ExampleCard)
-            if card_component and card_component.is_hovered:
+            if not self._is_card_on_screen(entity):
+                continue
+            if entity.card_rect.collidepoint(content_pos):
                 # Navigate to code viewer scene
                 example_info = entity.example_info
                 print(f"Opening code viewer for: {example_info.name}")
@@ -356,4 +452,4 @@ class MainMenuScene(BaseScene):
                     code_scene = CodeViewerScene(example_info, self.launcher)
                     self.interface.scene_manager.add_scene("code_viewer", code_scene)
                     self.interface.scene_manager.set_scene("code_viewer")
-                break
\ No newline at end of file
+                break
@@ -1,6 +1,21 @@
+import numpy as np
 import pygame
 from engine.core.scenes.base_scene import BaseScene
 
+def _wave_step(prev, curr, damping, scratch):
+    """Four-neighbour wave stencil over the interior, computed in place.
+    
+    Every ufunc writes into an existing buffer, so a step allocates no temporaries.
+    """
+    neighbours = scratch[1:-1, 1:-1]
+    np.add(prev[:-2, 1:-1], prev[2:, 1:-1], out=neighbours)
+    neighbours += prev[1:-1, :-2]
+    neighbours += prev[1:-1, 2:]
+    neighbours *= 0.5
+    inner = curr[1:-1, 1:-1]
+    np.subtract(neighbours, inner, out=inner)
+    inner *= damping
+
 class LiquidDemoScene(BaseScene):
     def __init__(self, width=200, height=150, scale=4):
         super().__init__()
@@ -9,13 +24,24 @@ class LiquidDemoScene(BaseScene):
         self.scale = scale
         self.damping = 0.99
         # Height buffers
-        self.current = [[0.0 for _ in range(height)] for _ in range(width)]
-        self.previous = [[0.0 for _ in range(height)] for _ in range(width)]
+        self.current = np.zeros((width, height), dtype=np.float32)
+        self.previous = np.zeros((width, height), dtype=np.float32)
         self.surface = pygame.Surface((width, height))
+        # Scratch buffers reused every frame so the update allocates nothing
+        self._scratch = np.zeros((width, height), dtype=np.float32)
+        self._shade = np.zeros((width, height), dtype=np.int32)
+
+    def on_initialize(self):
+        # The display exists now, so match its pixel format for fast scaling and blitting
+        self.surface = self.surface.convert()
+        # Scaled frame reused every render instead of allocating a new one
+        self._scaled = pygame.Surface(
+            (self.grid_width * self.scale, self.grid_height * self.scale)
+        ).convert()
 
     def disturb(self, x, y, magnitude=100.0):
         if 1 <= x < self.grid_width-1 and 1 <= y < self.grid_height-1:
-            self.previous[x][y] = magnitude
+            self.previous[x, y] = magnitude
 
     def handle_event(self, event):
         super().handle_event(event)
@@ -28,29 +54,19 @@ class LiquidDemoScene(BaseScene):
         super().update(delta_time)
         if not self._is_loaded:
             return
-        for x in range(1, self.grid_width-1):
-            for y in range(1, self.grid_height-1):
-                val = (
-                    self.previous[x-1][y] +
-                    self.previous[x+1][y] +
-                    self.previous[x][y-1] +
-                    self.previous[x][y+1]
-                ) / 2 - self.current[x][y]
-                val *= self.damping
-                self.current[x][y] = val
+        _wave_step(self.previous, self.current, self.damping, self._scratch)
         # Swap buffers
         self.current, self.previous = self.previous, self.current
 
-        # Update surface pixels
-        for x in range(self.grid_width):
-            for y in range(self.grid_height):
-                c = 127 + int(self.current[x][y])
-                c = max(0, min(255, c))
-                self.surface.set_at((x, y), (0, 0, c))
+        # Write the shade straight into the surface's blue channel; red and green stay zero
+        shade = self._shade
+        np.copyto(shade, self.current, casting='unsafe')
+        shade += 127
+        np.clip(shade, 0, 255, out=shade)
+        blue = pygame.surfarray.pixels_blue(self.surface)
+        blue[...] = shade
+        del blue  # Release the surface lock before it is blitted
 
     def render(self, screen: pygame.Surface):
-        scaled = pygame.transform.scale(
-            self.surface,
-            (self.grid_width * self.scale, self.grid_height * self.scale)
-        )
-        screen.blit(scaled, (0, 0))
+        pygame.transform.scale(self.surface, self._scaled.get_size(), self._scaled)
+        screen.blit(self._scaled, (0, 0))
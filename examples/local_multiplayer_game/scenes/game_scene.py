@@ -1,5 +1,5 @@
 import pygame
-from engine.core.scenes.base_scene import BaseScene
+from engine.core.scenes.base_scene import BaseScene, CollisionConfig
 from engine.core.entity import Entity
 from engine.core.components.keyboard_controller import KeyboardController
 from engine.core.components.rectangle_renderer import RectangleRenderer
@@ -7,17 +7,22 @@ from engine.core.components.collider import Collider
 from engine.core.components.physics import Physics
 from engine.core.components.debug_info import DebugInfoComponent
 from engine.core.components.ui_component import UIComponent
-from engine.core.scenes.collision_system import CollisionSystem
 import os
 
 class GameScene(BaseScene):
     def __init__(self, num_threads: int = None):
-        super().__init__(num_threads)
-        self.collision_system = CollisionSystem()
+        # Platforms never move, so always use the spatial hash: they are bucketed once
+        # and only the player is re-bucketed each frame
+        collision_config = CollisionConfig(grid_cell_size=64.0, max_entities_for_bruteforce=0)
+        super().__init__(num_threads, collision_config=collision_config)
         self.paused = False
         self._is_loaded = False  # Start as not loaded
         self._loading_steps = ['resources', 'entities', 'physics']
         self._current_step = 0
+        
+        # Resources used every frame, looked up once after loading
+        self._bg_surface = None
+        self._jump_sound = None
 
     def get_required_resources(self) -> dict:
         """Specify resources that need to be loaded"""
@@ -30,26 +35,19 @@ class GameScene(BaseScene):
         }
 
     def load_resources(self):
-        """Load all required resources"""
-        print("Loading game resources...")
-        required_resources = self.get_required_resources()
-        total_resources = len(required_resources)
-        loaded = 0
-
-        for name, path in required_resources.items():
-            try:
-                print(f"Loading resource: {path}")
-                self.add_resource(name, path)
-                loaded += 1
-                print(f"Successfully loaded: {path}")
-            except Exception as e:
-                print(f"Failed to load resource {name}: {e}")
-
-            # Calculate progress based on current step and resource loading
-            step_progress = (loaded / total_resources) * 100
-            self._loading_progress = (self._current_step * 100 + step_progress) / len(self._loading_steps)
+        """Load all required resources
+        
+        Called once per frame until done; files are read in the background
+        (see BaseScene._load_resources_async).
+        """
+        # Calculate progress based on current step and resource loading
+        step_progress = self._load_resources_async(self.get_required_resources()) * 100
+        self._loading_progress = (self._current_step * 100 + step_progress) / len(self._loading_steps)
+        if step_progress < 100:
+            return
 
-        print(f"Loaded {loaded}/{total_resources} resources")
+        self._bg_surface = self.get_resource('game_background')
+        self._jump_sound = self.get_resource('jump_sound')
         self._current_step += 1  # Move to next step
         print(f"Moving to step {self._current_step}")
 
@@ -92,11 +90,9 @@ class GameScene(BaseScene):
         if self.paused:
             return
 
-        # First update all entities using parallel processing
+        # Update all entities using parallel processing; BaseScene also runs
+        # self.collision_system once per frame, so it is not updated again here
         super().update(delta_time)
-        
-        # Then update collision system
-        self.collision_system.update(self.entities)
 
     def on_enter(self, previous_scene):
         """Called when scene becomes active"""
@@ -144,6 +140,8 @@ class GameScene(BaseScene):
         """Clean up scene resources"""
         self.collision_system.clear()
         pygame.mixer.music.stop()
+        self._bg_surface = None
+        self._jump_sound = None
         super().cleanup()  # Call base class cleanup
 
 class Player(Entity):
@@ -158,6 +156,7 @@ class Player(Entity):
         physics.restitution = 0.0  # No bounce for better platforming feel
         self.physics = physics
         self.controller = self.add_component(KeyboardController(speed=5.0))
+        self.jump_sound = scene._jump_sound if scene else None
 
         # Set up collision response
         self.collider.set_collision_layer(0)  # Player layer
@@ -168,9 +167,8 @@ class Player(Entity):
         if self.physics.is_grounded and self.scene:
             self.physics.apply_impulse(0, -12.0)  # Upward impulse
             # Play jump sound if available
-            jump_sound = self.scene.get_resource('jump_sound')
-            if jump_sound:
-                jump_sound.play()
+            if self.jump_sound:
+                self.jump_sound.play()
 
 class Platform(Entity):
     def __init__(self, x: float, y: float, width: float, height: float, color: tuple):
@@ -267,6 +265,11 @@ class DemoScene(GameScene):
         self.player = None
         self.debug_info = None
         
+        # Nothing in the world moves while paused, so it is drawn once and reused
+        self._paused_frame = None
+        self._paused_frame_reused = False
+        self._last_ui_rects = None  # Rects presented last frame (None after a full flip)
+        
     def initialize_entities(self):
         """Initialize game entities"""
         print("Initializing DemoScene entities...")
@@ -323,12 +326,47 @@ class DemoScene(GameScene):
         return self.ui_manager.score if self.ui_manager else 0
 
     def render(self, screen: pygame.Surface):
-        # Draw background
-        background = self.get_resource('game_background')
-        if background:
-            screen.blit(background, (0, 0))
-        else:
-            screen.fill((20, 20, 20))
+        self._paused_frame_reused = False
+        if self.paused and self._is_loaded and self.ui_manager:
+            # A fully opaque menu hides the world, so skip drawing it
+            if self.ui_manager.ui.is_fullscreen_opaque(screen.get_size()):
+                self._render_ui_group(screen)
+                return
+            if self._paused_frame is None:
+                self._render_background(screen)
+                self._render_world(screen)
+                self._paused_frame = screen.copy()
+            else:
+                screen.blit(self._paused_frame, (0, 0))
+                self._paused_frame_reused = True
+            self._render_ui_group(screen)
+            return
+        self._paused_frame = None
+        
+        self._render_background(screen)
             
         # Render game entities
         super().render(screen)
+
+    def _render_background(self, screen: pygame.Surface):
+        # Draw background
+        if self._bg_surface is not None:
+            screen.blit(self._bg_surface, (0, 0))
+        else:
+            screen.fill((20, 20, 20))
+
+    def get_dirty_rects(self):
+        """While paused over a reused frame only the UI can change on screen"""
+        rects = None
+        # Only the UI manager's elements have known bounds; anything else forces a full flip
+        if self._paused_frame_reused and self.get_entities_by_group("ui") == [self.ui_manager]:
+            rects = [
+                pygame.Rect(*element.get_absolute_position(), element.width, element.height)
+                for element in self.ui_manager.ui.root.children
+                if element.visible
+            ]
+        previous, self._last_ui_rects = self._last_ui_rects, rects
+        if rects is None or previous is None:
+            return rects
+        # Also present where elements were last frame, so hidden or moved ones get cleared
+        return previous + rects
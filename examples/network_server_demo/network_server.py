@@ -1,17 +1,36 @@
 from engine.multiplayer import DedicatedServer
-import time
+import asyncio
+import signal
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+async def run(server: DedicatedServer):
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown_event.set)
+        except NotImplementedError:
+            # Windows: Ctrl+C surfaces as KeyboardInterrupt instead
+            pass
+    print(f"Server listening on {server.host}:{server.port}")
+    await server.serve(shutdown_event)
 
 
 def main():
     server = DedicatedServer()
-    server.start()
-    print(f"Server listening on {server.host}:{server.port}")
+    # uvloop is optional; it swaps in a libuv-based event loop when installed
+    run_loop = uvloop.run if uvloop is not None else asyncio.run
     try:
-        while True:
-            time.sleep(1)
+        run_loop(run(server))
     except KeyboardInterrupt:
-        print("Shutting down server...")
-    server.stop()
+        pass
+    print("Shutting down server...")
+    server.sock.close()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,10 @@ from engine import Component
 class ExampleComponent(Component):
     """Exemplo de componente personalizado."""
     
+    # Declare aqui todo atributo novo: sem __dict__ cada instância ocupa menos memória
+    # e o acesso aos atributos é mais rápido
+    __slots__ = ('example_value', 'timer')
+    
     def __init__(self, example_value: float = 1.0):
         super().__init__()
         self.example_value = example_value
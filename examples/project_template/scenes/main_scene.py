@@ -4,22 +4,50 @@ Customize esta scene para seu jogo específico
 """
 
 import pygame
-from engine import BaseScene, Entity, Component
+from engine import BaseScene, Entity, Component, get_font
 
 class MainScene(BaseScene):
     """Scene principal do jogo."""
     
+    # Instruções exibidas no centro da tela
+    INSTRUCTIONS = [
+        "Customize este template para seu jogo",
+        "Adicione entidades em on_initialize()",
+        "Implemente lógica em update()",
+        "Adicione rendering em render()",
+        "ESC para sair"
+    ]
+    
     def __init__(self):
         super().__init__()
         self.font = None
+        self.instruction_font = None
+        
+        # Textos renderizados uma única vez em on_initialize
+        self._title_surface = None
+        self._instruction_surfaces = []
+        # Pares (surface, rect) calculados no primeiro render; refeitos só quando a janela muda de tamanho
+        self._ui_blits = None
+        
+        # Tecla -> ação; adicione seus controles aqui
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._quit,
+        }
         
     def on_initialize(self):
         """Inicializar recursos da scene."""
         print("Inicializando scene principal...")
         
-        # Inicializar fonte para UI
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 48)
+        # Fontes para UI (compartilhadas entre scenes, abertas uma única vez)
+        self.font = get_font(48)
+        self.instruction_font = get_font(24)
+        
+        # Pré-renderizar os textos fixos (rasterizar fonte a cada frame é caro)
+        self._title_surface = self.font.render("Meu Projeto PyEngine", True, (255, 255, 255))
+        self._instruction_surfaces = [
+            self.instruction_font.render(instruction, True, (255, 255, 255))
+            for instruction in self.INSTRUCTIONS
+        ]
         
         # TODO: Adicionar suas entidades aqui
         # Exemplo:
@@ -50,37 +78,38 @@ class MainScene(BaseScene):
         
     def _render_ui(self, screen: pygame.Surface):
         """Renderizar interface do usuário."""
-        if not self.font:
+        if not self._title_surface:
             return
             
-        # Título de exemplo
-        title_text = self.font.render("Meu Projeto PyEngine", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(screen.get_width() // 2, 100))
-        screen.blit(title_text, title_rect)
-        
-        # Instruções
-        instruction_font = pygame.font.Font(None, 24)
-        instructions = [
-            "Customize este template para seu jogo",
-            "Adicione entidades em on_initialize()",
-            "Implemente lógica em update()",
-            "Adicione rendering em render()",
-            "ESC para sair"
-        ]
+        if self._ui_blits is None:
+            center_x = screen.get_width() // 2
+            y_start = screen.get_height() // 2
+            
+            # Título de exemplo, seguido das instruções
+            self._ui_blits = [(self._title_surface, self._title_surface.get_rect(center=(center_x, 100)))]
+            self._ui_blits.extend(
+                (text, text.get_rect(center=(center_x, y_start + i * 30)))
+                for i, text in enumerate(self._instruction_surfaces)
+            )
         
-        y_start = screen.get_height() // 2
-        for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, (255, 255, 255))
-            text_rect = text.get_rect(center=(screen.get_width() // 2, y_start + i * 30))
-            screen.blit(text, text_rect)
+        # Tudo numa única chamada
+        screen.blits(self._ui_blits, False)
     
     def handle_event(self, event: pygame.event.Event):
         """Processar eventos."""
         super().handle_event(event)
         
-        # TODO: Adicionar seus controles aqui
+        # A posição dos textos depende do tamanho da janela
+        if event.type == pygame.VIDEORESIZE:
+            self._ui_blits = None
+        
+        # TODO: Adicionar seus controles em self._key_handlers
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                # Sair do jogo
-                if self.interface:
-                    self.interface.running = False
\ No newline at end of file
+            handler = self._key_handlers.get(event.key)
+            if handler:
+                handler()
+    
+    def _quit(self):
+        """Sair do jogo."""
+        if self.interface:
+            self.interface.running = False
\ No newline at end of file
@@ -1,11 +1,14 @@
-import multiprocessing as mp
+import os
 from engine import create_engine
 from scenes.puzzle_scene import PuzzleScene
 
 
 def main():
-    # Get CPU cores for processing
-    cpu_count = mp.cpu_count()
+    # Get CPU cores for processing (only the ones this process may run on)
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = os.cpu_count() or 1
     num_threads = max(1, int(cpu_count * 0.75))
 
     # Create engine
@@ -1,14 +1,18 @@
 import time
+from array import array
 import pygame
 from engine.core.entity import Entity
 from engine.core.components.texture_renderer import TextureRenderer
 
+# IDs the preloaded textures are cached under, built once per process
+_PRELOAD_IDS = tuple(f"preload_texture_{i}" for i in range(10))
+
 def run_demo(scene):
     """Demo showing asynchronous preloading"""
     scene.demo_state = "preloading"
-    scene.load_times = []
+    scene.load_times = array('q')
     scene.preload_progress = 0
-    scene.preload_total = 10
+    scene.preload_total = len(_PRELOAD_IDS)
     
     # Clear cache
     scene.resource_manager.clear_cache()
@@ -16,19 +20,17 @@ def run_demo(scene):
     # Start preloading resources
     base_texture_path = "assets/character.png"
     
-    # Define a callback to track progress
+    # Track progress as each resource arrives
     def on_resource_loaded(resource_id):
         scene.preload_progress += 1
-        
-        # When all resources are loaded, create entities
-        if scene.preload_progress >= scene.preload_total:
-            create_preloaded_entities(scene)
     
-    # Preload the same texture with different IDs
-    for i in range(scene.preload_total):
-        resource_id = f"preload_texture_{i}"
-        scene.resource_manager.preload_resource(base_texture_path, resource_id, "texture")
-        scene.resource_manager.on_resource_loaded(resource_id, on_resource_loaded)
+    # Preload the same texture with different IDs in one batch; entities are
+    # created once the whole batch is loaded
+    scene.resource_manager.preload_many(
+        [(base_texture_path, resource_id, "texture") for resource_id in _PRELOAD_IDS],
+        on_resource_loaded,
+        lambda: create_preloaded_entities(scene)
+    )
 
 def create_preloaded_entities(scene):
     """Create entities using preloaded resources"""
@@ -40,8 +42,7 @@ def create_preloaded_entities(scene):
     start_x = 300
     start_y = 150
     
-    for i in range(scene.preload_total):
-        resource_id = f"preload_texture_{i}"
+    for i, resource_id in enumerate(_PRELOAD_IDS):
         
         row = i // grid_size
         col = i % grid_size
@@ -1,4 +1,5 @@
 import time
+from array import array
 import pygame
 from engine.core.entity import Entity
 from engine.core.components.sprite_animation import SpriteAnimation
@@ -6,7 +7,7 @@ from engine.core.components.sprite_animation import SpriteAnimation
 def run_demo(scene):
     """Demo showing sprite sheet frame caching"""
     scene.demo_state = "running"
-    scene.load_times = []
+    scene.load_times = array('q')
     
     # Load sprite sheet
     sprite_sheet_path = "assets/character_sheet.png"
@@ -18,7 +19,7 @@ def run_demo(scene):
     
     sprite_anim1 = SpriteAnimation()
     
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     sprite_anim1.load_sprite_sheet(sprite_sheet_path)
     sprite_anim1.create_animation_from_lane(
         name="walk",
@@ -30,8 +31,7 @@ def run_demo(scene):
         frame_duration=0.1,
         loop=True
     )
-    end_time = time.time()
-    scene.load_times.append(end_time - start_time)
+    scene.load_times.append(time.perf_counter_ns() - start_time)
     
     sprite_anim1.play("walk")
     entity1.add_component(sprite_anim1)
@@ -45,7 +45,7 @@ def run_demo(scene):
     
     sprite_anim2 = SpriteAnimation()
     
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     sprite_anim2.load_sprite_sheet(sprite_sheet_path)
     sprite_anim2.create_animation_from_lane(
         name="walk",
@@ -57,8 +57,7 @@ def run_demo(scene):
         frame_duration=0.1,
         loop=True
     )
-    end_time = time.time()
-    scene.load_times.append(end_time - start_time)
+    scene.load_times.append(time.perf_counter_ns() - start_time)
     
     sprite_anim2.play("walk")
     entity2.add_component(sprite_anim2)
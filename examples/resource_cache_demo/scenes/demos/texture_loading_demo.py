@@ -1,4 +1,5 @@
 import time
+from array import array
 import pygame
 from engine.core.entity import Entity
 from engine.core.components.texture_renderer import TextureRenderer
@@ -6,14 +7,13 @@ from engine.core.components.texture_renderer import TextureRenderer
 def run_demo(scene):
     """Demo showing texture loading cache"""
     scene.demo_state = "running"
-    scene.load_times = []
+    scene.load_times = array('q')
     
     # First load - should be slow
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     texture_path = "assets/character.png"
     texture = scene.resource_manager.load_texture(texture_path)
-    end_time = time.time()
-    scene.load_times.append(end_time - start_time)
+    scene.load_times.append(time.perf_counter_ns() - start_time)
     
     # Create entity to display the texture
     entity = Entity()
@@ -28,10 +28,9 @@ def run_demo(scene):
     scene.demo_entities.append(entity)
     
     # Second load - should be fast (cached)
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     texture2 = scene.resource_manager.load_texture(texture_path)
-    end_time = time.time()
-    scene.load_times.append(end_time - start_time)
+    scene.load_times.append(time.perf_counter_ns() - start_time)
     
     # Create second entity with same texture
     entity2 = Entity()
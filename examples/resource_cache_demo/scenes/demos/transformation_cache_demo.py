@@ -1,12 +1,16 @@
 import time
+from array import array
 import pygame
 from engine.core.entity import Entity
 from engine.core.components.texture_renderer import TextureRenderer
 
+# Render target used only to force the transformed texture to be created
+_SCRATCH = pygame.Surface((1, 1))
+
 def run_demo(scene):
     """Demo showing transformation caching"""
     scene.demo_state = "running"
-    scene.load_times = []
+    scene.load_times = array('q')
     
     texture_path = "assets/character.png"
     
@@ -29,13 +33,11 @@ def run_demo(scene):
     texture_renderer2 = TextureRenderer()
     texture_renderer2.load_texture(texture_path)
     
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     texture_renderer2.set_scale(2.0, 2.0)
     # Force rendering to create the transformed texture
-    surface = pygame.Surface((1, 1))
-    texture_renderer2.render(surface, (0, 0))
-    end_time = time.time()
-    scene.load_times.append(end_time - start_time)
+    texture_renderer2.render(_SCRATCH, (0, 0))
+    scene.load_times.append(time.perf_counter_ns() - start_time)
     
     entity2.add_component(texture_renderer2)
     scene.add_entity(entity2)
@@ -49,13 +51,11 @@ def run_demo(scene):
     texture_renderer3 = TextureRenderer()
     texture_renderer3.load_texture(texture_path)
     
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     texture_renderer3.set_scale(2.0, 2.0)
     # Force rendering to create the transformed texture
-    surface = pygame.Surface((1, 1))
-    texture_renderer3.render(surface, (0, 0))
-    end_time = time.time()
-    scene.load_times.append(end_time - start_time)
+    texture_renderer3.render(_SCRATCH, (0, 0))
+    scene.load_times.append(time.perf_counter_ns() - start_time)
     
     entity3.add_component(texture_renderer3)
     scene.add_entity(entity3)
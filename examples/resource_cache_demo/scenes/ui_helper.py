@@ -1,3 +1,4 @@
+from functools import partial
 from .ui_wrapper import ButtonWrapper, LabelWrapper
 
 def create_ui(scene):
@@ -22,8 +23,8 @@ def create_ui(scene):
             height=30,
             text=name
         )
-        # Set click handler
-        button.set_on_click(lambda idx=i: scene._on_demo_button_click(idx))
+        # Set click handler (the scene's bound method with the index pre-applied)
+        button.set_on_click(partial(scene._on_demo_button_click, i))
         button.demo_index = i
         scene.demo_buttons.append(button)
         scene.add_entity(button)
@@ -52,17 +53,21 @@ def create_ui(scene):
         scene.stats_labels.append(label)
         scene.add_entity(label)
 
+def clear_stats(scene):
+    """Empty all stats labels (no text is rendered for them)"""
+    for label in scene.stats_labels:
+        label.clear()
+
 def update_stats_labels(scene):
     """Update the stats labels with current information"""
     # Clear existing labels
-    for label in scene.stats_labels:
-        label.set_text("")
+    clear_stats(scene)
     
-    # Update load time comparison if available
+    # Update load time comparison if available (load_times are in nanoseconds)
     if len(scene.load_times) >= 2:
-        scene.stats_labels[0].set_text(f"First load time: {scene.load_times[0]*1000:.2f}ms")
-        scene.stats_labels[1].set_text(f"Second load time: {scene.load_times[1]*1000:.2f}ms")
-        speedup = scene.load_times[0] / max(scene.load_times[1], 0.0001)
+        scene.stats_labels[0].set_text(f"First load time: {scene.load_times[0] / 1e6:.2f}ms")
+        scene.stats_labels[1].set_text(f"Second load time: {scene.load_times[1] / 1e6:.2f}ms")
+        speedup = scene.load_times[0] / max(scene.load_times[1], 1)
         scene.stats_labels[2].set_text(f"Speedup: {speedup:.2f}x")
     
     # Update cache stats if available
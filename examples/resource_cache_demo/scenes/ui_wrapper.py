@@ -1,22 +1,24 @@
-import pygame
-from typing import Tuple
 from engine.core.components.ui.button import Button
 from engine.core.components.ui.label import Label
 
 class ButtonWrapper(Button):
-    """A wrapper for Button that can handle camera_offset parameter"""
+    """Button created with the resource cache demo's positional arguments"""
     def __init__(self, x: int, y: int, width: int, height: int, text: str):
         super().__init__(x, y, width, height, text)
-    
-    def render(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)):
-        """Render the button, ignoring camera_offset"""
-        super().render(screen)
 
 class LabelWrapper(Label):
-    """A wrapper for Label that can handle camera_offset parameter"""
+    """Label that tells the demo scene to redraw when its text changes"""
     def __init__(self, x: int, y: int, text: str, font_size: int = 24):
         super().__init__(x, y, text, font_size)
     
-    def render(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)):
-        """Render the label, ignoring camera_offset"""
-        super().render(screen)
+    def set_text(self, text: str):
+        """Update the text, asking the scene to redraw if it changed"""
+        if text != self.text and self.scene is not None:
+            self.scene._dirty = True
+        super().set_text(text)
+    
+    def clear(self):
+        """Empty the label, asking the scene to redraw if it had text"""
+        if self.text and self.scene is not None:
+            self.scene._dirty = True
+        super().clear()
@@ -13,6 +13,8 @@ class SimpleResourceScene(BaseScene):
         self.resource_manager = ResourceManager.get_instance()
         self.entities = []
         self.labels = []
+        self._current_texture_path = None  # Texture currently shown by texture_renderer
+        self._stats_text = None
         
     def load_resources(self):
         """Load resources for the demo"""
@@ -66,19 +68,26 @@ class SimpleResourceScene(BaseScene):
     
     def load_texture(self, path):
         """Load a texture using the ResourceManager"""
-        # Load the texture
-        texture = self.resource_manager.load_texture(path)
-        
-        if texture:
+        # Already showing this texture: nothing to load or set
+        if path != self._current_texture_path:
+            # Load the texture
+            texture = self.resource_manager.load_texture(path)
+            if not texture:
+                return
+            
             # Set the texture on the renderer
             self.texture_renderer.set_texture(texture)
+            self._current_texture_path = path
             
-            # Update stats
-            stats = self.resource_manager.get_stats()
-            self.stats_label.set_text(
-                f"Cache: {stats['cache']['total_resources']} resources, "
-                f"{stats['cache']['memory_usage_mb']:.2f}MB used"
-            )
+        # Update stats (re-rendering the label only when they changed)
+        stats = self.resource_manager.get_stats()
+        stats_text = (
+            f"Cache: {stats['cache']['total_resources']} resources, "
+            f"{stats['cache']['memory_usage_mb']:.2f}MB used"
+        )
+        if stats_text != self._stats_text:
+            self.stats_label.set_text(stats_text)
+            self._stats_text = stats_text
     
     def handle_event(self, event):
         """Handle input to change textures"""
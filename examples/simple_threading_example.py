@@ -1,42 +1,76 @@
 import multiprocessing as mp
+import numpy as np
 from engine import create_engine
 from engine.core.scenes.base_scene import BaseScene
 from engine.core.entity import Entity
 from engine.core.component import Component
 
 class SimpleMovementComponent(Component):
-    """Simple component for demonstration."""
+    """Simple component for demonstration.
     
-    def __init__(self, speed=50.0):
+    Per-entity view onto one row of the scene's movement arrays; the scene moves
+    every entity in a single vectorized step, so there is no update of its own.
+    """
+    
+    __slots__ = ('scene', 'index')
+    needs_update = False
+    
+    def __init__(self, scene, index):
         super().__init__()
-        self.speed = speed
-        self.direction = 1
+        self.scene = scene
+        self.index = index
         
-    def update(self):
-        if not self.entity:
-            return
-            
-        # Simple movement with bouncing
-        self.entity.position.x += self.direction * self.speed * self.entity.delta_time
+    @property
+    def speed(self):
+        return float(self.scene.speed[self.index])
         
-        # Bounce off screen edges
-        if self.entity.position.x > 800 or self.entity.position.x < 0:
-            self.direction *= -1
+    @property
+    def direction(self):
+        return int(self.scene.direction[self.index])
 
 class SimpleThreadingScene(BaseScene):
     """Simple scene demonstrating threaded entity updates."""
     
+    def __init__(self):
+        super().__init__()
+        # Movement state for all entities, one row per entity
+        self.pos_x = None
+        self.speed = None
+        self.direction = None
+        self._moving_entities = []
+    
     def on_initialize(self):
         print("Creating entities for threading demonstration...")
         
         # Create many entities to demonstrate threading benefits
-        for i in range(500):
-            entity = Entity(x=400, y=50 + i)
-            movement = SimpleMovementComponent(speed=100 + i % 100)
-            entity.add_component(movement)
-            self.add_entity(entity)
+        count = 500
+        self.pos_x = np.full(count, 400.0)
+        self.speed = 100.0 + np.arange(count) % 100
+        self.direction = np.ones(count)
+        self._moving_entities = [self._create_entity(i) for i in range(count)]
+        self.add_entities(self._moving_entities)
             
         print(f"Created {len(self.entities)} entities")
+        
+    def _create_entity(self, i):
+        entity = Entity(x=400, y=50 + i)
+        movement = SimpleMovementComponent(self, i)
+        entity.add_component(movement)
+        return entity
+        
+    def update(self, delta_time: float):
+        super().update(delta_time)
+        if not self._is_loaded or self.pos_x is None:
+            return
+        
+        # Simple movement with bouncing, for all entities at once
+        self.pos_x += self.direction * self.speed * delta_time
+        
+        # Bounce off screen edges
+        self.direction[(self.pos_x > 800) | (self.pos_x < 0)] *= -1
+        
+        for entity, x in zip(self._moving_entities, self.pos_x.tolist()):
+            entity.position.x = x
 
 def main():
     cpu_count = mp.cpu_count()
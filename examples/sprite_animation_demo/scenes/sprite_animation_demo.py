@@ -3,9 +3,12 @@ import os
 from engine.core.scenes.base_scene import BaseScene
 from engine.core.entity import Entity
 from engine.core.components.sprite_animation import SpriteAnimation
-from engine.core.components.ui.label import Label
+from engine.core.components.ui.font_registry import get_font, render_text
 
 class SpriteAnimationDemo(BaseScene):
+    # Print every animation frame change (several lines per second; for debugging only)
+    debug_frames = False
+    
     def __init__(self):
         super().__init__()
         self.character = None
@@ -13,8 +16,8 @@ class SpriteAnimationDemo(BaseScene):
         self.current_speed = 1.0
         self.walking_left = False
         self.walking_right = False
-        self.instruction_labels = []
-        self.speed_label = None
+        # (surface, position) pairs for the instruction lines; the last one is the speed line
+        self._instruction_blits = []
         
     def on_animation_finish(self):
         """Callback when an animation finishes"""
@@ -55,7 +58,7 @@ class SpriteAnimationDemo(BaseScene):
                     self.sprite_animation.set_animation_callback(
                         "idle",
                         on_finish=self.on_animation_finish,
-                        on_frame=self.on_frame_change
+                        on_frame=self.on_frame_change if self.debug_frames else None
                     )
                 
                 # Add walk animation (second row: 5 frames of 100x160)
@@ -96,7 +99,7 @@ class SpriteAnimationDemo(BaseScene):
             # Create a fallback colored rectangle for testing
             self._create_fallback_character()
         
-        # Create instruction labels
+        # Pre-render instruction text
         self._create_instruction_labels()
         
         # Mark scene as loaded
@@ -113,7 +116,7 @@ class SpriteAnimationDemo(BaseScene):
         self.add_entity(self.character)
     
     def _create_instruction_labels(self):
-        """Create instruction labels using the engine's label system"""
+        """Pre-render the instruction lines, drawn together with one blits call"""
         instructions = [
             "Press 1: Play Idle Animation (5 frames, 100x160)",
             "Hold Left/Right: Walk Animation (5 frames, 100x160)",
@@ -121,43 +124,21 @@ class SpriteAnimationDemo(BaseScene):
             "Up/Down Arrows: Change Animation Speed"
         ]
         
-        # Clear existing labels
-        for label in self.instruction_labels:
-            self.add_entity(label)
-        self.instruction_labels.clear()
-        
-        # Remove existing speed label
-        if self.speed_label:
-            self.add_entity(self.speed_label)
-        
-        # Create instruction labels and add to scene
-        y_offset = 10
-        for instruction in instructions:
-            label = Label(
-                x=10,
-                y=y_offset,
-                text=instruction,
-                font_size=20
-            )
-            label.set_text_color((255, 255, 255))  # White text
-            self.instruction_labels.append(label)
-            self.add_entity(label)  # Add to scene
-            y_offset += 25
+        # Rasterized once and shared across scene reloads
+        self._instruction_blits = [
+            (render_text(instruction, 20, (255, 255, 255)), (15, 15 + i * 25))  # White text
+            for i, instruction in enumerate(instructions)
+        ]
         
-        # Create speed label and add to scene
-        self.speed_label = Label(
-            x=10,
-            y=y_offset,
-            text=f"Current Speed: {self.current_speed:.1f}x",
-            font_size=20
-        )
-        self.speed_label.set_text_color((255, 255, 0))  # Yellow for emphasis
-        self.add_entity(self.speed_label)  # Add to scene
+        # Speed line goes last, updated in place when the speed changes
+        self._instruction_blits.append(None)
+        self._update_speed_display()
         
     def _update_speed_display(self):
-        """Update the speed display label"""
-        if self.speed_label:
-            self.speed_label.set_text(f"Current Speed: {self.current_speed:.1f}x")
+        """Update the speed display line"""
+        if self._instruction_blits:
+            text = get_font(20).render(f"Current Speed: {self.current_speed:.1f}x", True, (255, 255, 0))  # Yellow for emphasis
+            self._instruction_blits[-1] = (text, (15, 15 + (len(self._instruction_blits) - 1) * 25))
         
     def handle_event(self, event: pygame.event.Event):
         """Handle input to change animations"""
@@ -232,5 +213,7 @@ class SpriteAnimationDemo(BaseScene):
     
     def render(self, screen: pygame.Surface):
         """Render the scene"""
-        # Render entities and UI elements
-        super().render(screen)
\ No newline at end of file
+        # Render entities, then all instruction lines in a single call
+        super().render(screen)
+        if self._is_loaded and self._instruction_blits:
+            screen.blits(self._instruction_blits, False)
\ No newline at end of file
@@ -4,107 +4,110 @@ Creates many entities with physics and visual effects to showcase threading perf
 """
 
 import pygame
-import random
 import time
-import math
+import numpy as np
+from collections import deque
+from typing import Dict, Tuple
 from engine import BaseScene, Entity, Component, ThreadConfig
 
+def _move_axis(pos, direction, speed, dt, limit, step, hit, below, rng):
+    """Advance one axis in place and reflect entities that left [0, limit].
+    
+    Whole-array work writes into the preallocated step/hit/below buffers; only
+    the handful of entities that bounce this frame are gathered.
+    """
+    np.multiply(direction, speed, out=step)
+    step *= dt
+    pos += step
+    
+    # Bounce off screen edges with slight randomness
+    np.less(pos, 0, out=below)
+    np.greater(pos, limit, out=hit)
+    hit |= below
+    bounced = np.flatnonzero(hit)
+    if bounced.size:
+        direction[bounced] = -direction[bounced] + rng.uniform(-0.1, 0.1, bounced.size)
+        
+    # Keep within bounds
+    np.clip(pos, 0, limit, out=pos)
+
 class MovementComponent(Component):
-    """Component that moves entities in random directions with realistic physics."""
+    """Per-entity view onto one row of the scene's movement arrays.
+    
+    The scene moves every entity in a single vectorized step, so this component
+    has no update of its own.
+    """
+    
+    __slots__ = ('scene', 'index')
+    needs_update = False
     
-    def __init__(self, speed: float = 100.0):
+    def __init__(self, scene: 'ThreadingDemoScene', index: int):
         super().__init__()
-        self.speed = speed
-        self.direction_x = random.uniform(-1, 1)
-        self.direction_y = random.uniform(-1, 1)
-        self.bounce_timer = 0.0
-        self.bounce_cooldown = random.uniform(1.5, 3.0)  # Random direction change interval
-        
-    def update(self):
-        if not self.entity:
-            return
-            
-        dt = self.entity.delta_time
-        
-        # Update position based on velocity
-        self.entity.position.x += self.direction_x * self.speed * dt
-        self.entity.position.y += self.direction_y * self.speed * dt
-        
-        # Bounce off screen edges with slight randomness
-        if self.entity.position.x < 0 or self.entity.position.x > 800:
-            self.direction_x *= -1
-            self.direction_x += random.uniform(-0.1, 0.1)  # Add slight randomness
-        if self.entity.position.y < 0 or self.entity.position.y > 600:
-            self.direction_y *= -1
-            self.direction_y += random.uniform(-0.1, 0.1)  # Add slight randomness
-            
-        # Keep within bounds
-        self.entity.position.x = max(0, min(800, self.entity.position.x))
-        self.entity.position.y = max(0, min(600, self.entity.position.y))
+        self.scene = scene
+        self.index = index
         
-        # Occasionally change direction
-        self.bounce_timer += dt
-        if self.bounce_timer > self.bounce_cooldown:
-            self.direction_x += random.uniform(-0.5, 0.5)
-            self.direction_y += random.uniform(-0.5, 0.5)
-            # Normalize direction vector
-            length = (self.direction_x**2 + self.direction_y**2)**0.5
-            if length > 0:
-                self.direction_x /= length
-                self.direction_y /= length
-            self.bounce_timer = 0.0
-            self.bounce_cooldown = random.uniform(1.5, 3.0)  # New random interval
+    @property
+    def speed(self) -> float:
+        return float(self.scene.speed[self.index])
+        
+    @property
+    def direction_x(self) -> float:
+        return float(self.scene.dir_x[self.index])
+        
+    @property
+    def direction_y(self) -> float:
+        return float(self.scene.dir_y[self.index])
+        
+    @property
+    def bounce_timer(self) -> float:
+        return float(self.scene.bounce_timer[self.index])
 
 class RenderComponent(Component):
-    """Component for rendering entities with visual effects."""
+    """Per-entity view onto one row of the scene's visual arrays.
+    
+    Pulsing and drawing happen for all entities at once in the scene.
+    """
     
-    def __init__(self, color: tuple = (255, 255, 255), size: int = 5):
+    __slots__ = ('scene', 'index')
+    needs_update = False
+    
+    def __init__(self, scene: 'ThreadingDemoScene', index: int):
         super().__init__()
-        self.base_color = color
-        self.color = color
-        self.size = size
-        self.base_size = size
-        self.pulse_timer = 0.0
-        self.pulse_speed = random.uniform(1.0, 3.0)
-        
-    def update(self):
-        """Update visual effects like pulsing and color variation."""
-        if not self.entity:
-            return
-            
-        dt = self.entity.delta_time
-        self.pulse_timer += dt * self.pulse_speed
-        
-        # Pulse effect for size
-        pulse = 1.0 + 0.3 * math.sin(self.pulse_timer)
-        self.size = max(1, int(self.base_size * pulse))
+        self.scene = scene
+        self.index = index
         
-        # Subtle color variation
-        color_variation = 0.1 * math.sin(self.pulse_timer * 0.5)
-        self.color = (
-            max(0, min(255, int(self.base_color[0] * (1 + color_variation)))),
-            max(0, min(255, int(self.base_color[1] * (1 + color_variation)))),
-            max(0, min(255, int(self.base_color[2] * (1 + color_variation))))
-        )
+    @property
+    def base_color(self) -> tuple:
+        return tuple(self.scene.base_colors[self.index].astype(int).tolist())
         
-    def render(self, screen, camera_offset=(0, 0)):
-        if not self.entity:
-            return
-            
-        pos = (
-            int(self.entity.position.x - camera_offset[0]), 
-            int(self.entity.position.y - camera_offset[1])
-        )
-        pygame.draw.circle(screen, self.color, pos, self.size)
+    @property
+    def color(self) -> tuple:
+        return tuple(self.scene.colors[self.index].tolist())
         
-        # Add a subtle glow effect for larger entities
-        if self.size > 5:
-            glow_color = tuple(c // 3 for c in self.color)
-            pygame.draw.circle(screen, glow_color, pos, self.size + 2, 1)
+    @property
+    def size(self) -> int:
+        return int(self.scene.sizes[self.index])
 
 class ThreadingDemoScene(BaseScene):
     """Scene that demonstrates threaded entity updates with comprehensive performance monitoring."""
     
+    # Static help text shown in the bottom-left panel
+    INSTRUCTIONS = [
+        "Controls:",
+        "  ESC - Exit demo",
+        "  Watch performance metrics",
+        "",
+        "Features:",
+        "  • Multi-threaded entity updates",
+        "  • Real-time performance monitoring",
+        "  • Adaptive visual effects",
+        "  • Realistic physics simulation"
+    ]
+    TEXT_CACHE_SIZE = 64
+    COLOR_SHIFT = 5  # Sprite colors keep the top 3 bits of each channel
+    SIN_LUT_SIZE = 1024  # Power of two so table indices wrap with a mask
+    SIN_LUT = np.sin(np.arange(SIN_LUT_SIZE) * (2 * np.pi / SIN_LUT_SIZE)).astype(np.float32)
+    
     def __init__(self, entity_count: int = 1000, threading_enabled: bool = True):
         # Configure threading with optimized settings
         thread_config = ThreadConfig(
@@ -120,16 +123,47 @@ class ThreadingDemoScene(BaseScene):
         self.threading_enabled = threading_enabled
         
         # Performance tracking
-        self.frame_times = []
-        self.update_times = []
-        self.render_times = []
         self.max_samples = 60  # Track last 60 frames
+        self.frame_times = deque(maxlen=self.max_samples)
+        self.update_times = deque(maxlen=self.max_samples)
+        self.render_times = deque(maxlen=self.max_samples)
+        
+        # Movement state for all entities, one float32 column per field (row i = entity i)
+        self.pos_x = None
+        self.pos_y = None
+        self.dir_x = None
+        self.dir_y = None
+        self.speed = None
+        self.bounce_timer = None
+        self.bounce_cooldown = None
+        self._moving_entities = []
+        self.rng = np.random.default_rng()
+        
+        # Visual state: base values plus the pulsed size/color computed each frame
+        self.base_colors = None
+        self.base_sizes = None
+        self.pulse_timer = None
+        self.pulse_speed = None
+        self.colors = None
+        self.sizes = None
+        self._circle_sprites: Dict[int, pygame.Surface] = {}
+        
+        # Scratch buffers reused by every movement step
+        self._step = None
+        self._hit = None
+        self._below = None
         
         # UI and timing
         self.font = None
         self.small_font = None
         self.start_time = None
         
+        # Rendered overlay text and panel backgrounds, reused across frames
+        self._text_cache: Dict[Tuple[str, bool], pygame.Surface] = {}
+        self._panel_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._info_lines = []
+        self._stats_tick = 0
+        
     def on_initialize(self):
         """Create entities and initialize the demo scene."""
         # Initialize pygame font system
@@ -141,34 +175,38 @@ class ThreadingDemoScene(BaseScene):
         print(f"Creating {self.entity_count} entities for threading demo...")
         creation_start = time.time()
         
-        # Create entities with varied properties for interesting visuals
-        for i in range(self.entity_count):
-            # Random starting position (avoid edges)
-            x = random.uniform(50, 750)
-            y = random.uniform(50, 550)
-            entity = Entity(x, y)
-            
-            # Add movement component with varied speeds
-            speed = random.uniform(50, 250)
-            movement = MovementComponent(speed)
-            entity.add_component(movement)
-            
-            # Add render component with varied colors and sizes
-            # Create more interesting color palettes
-            color_type = random.choice(['warm', 'cool', 'bright'])
-            if color_type == 'warm':
-                color = (random.randint(150, 255), random.randint(100, 200), random.randint(50, 150))
-            elif color_type == 'cool':
-                color = (random.randint(50, 150), random.randint(100, 200), random.randint(150, 255))
-            else:  # bright
-                color = (random.randint(200, 255), random.randint(200, 255), random.randint(100, 255))
-                
-            size = random.randint(2, 10)
-            renderer = RenderComponent(color, size)
-            entity.add_component(renderer)
-            
-            self.add_entity(entity)
+        # Movement and visual columns, drawn in bulk from the scene's generator
+        n = self.entity_count
+        rng = self.rng
+        
+        # Random starting positions (avoid edges), varied speeds and direction change intervals
+        self.pos_x = rng.uniform(50, 750, n).astype(np.float32)
+        self.pos_y = rng.uniform(50, 550, n).astype(np.float32)
+        self.speed = rng.uniform(50, 250, n).astype(np.float32)
+        self.dir_x = rng.uniform(-1, 1, n).astype(np.float32)
+        self.dir_y = rng.uniform(-1, 1, n).astype(np.float32)
+        self.bounce_timer = np.zeros(n, dtype=np.float32)
+        self.bounce_cooldown = rng.uniform(1.5, 3.0, n).astype(np.float32)
+        self._step = np.zeros(n, dtype=np.float32)
+        self._hit = np.zeros(n, dtype=bool)
+        self._below = np.zeros(n, dtype=bool)
+        
+        # Varied colors and sizes from more interesting palettes: warm, cool and bright
+        palette_low = np.array([(150, 100, 50), (50, 100, 150), (200, 200, 100)])
+        palette_high = np.array([(255, 200, 150), (150, 200, 255), (255, 255, 255)])
+        color_type = rng.integers(0, 3, n)
+        self.base_colors = rng.integers(palette_low[color_type], palette_high[color_type] + 1).astype(np.float32)
+        self.base_sizes = rng.integers(2, 11, n).astype(np.float32)
+        self.pulse_timer = np.zeros(n, dtype=np.float32)
+        self.pulse_speed = rng.uniform(1.0, 3.0, n).astype(np.float32)
+        
+        # The entities are views onto their rows, added in one batch
+        entities = [self._create_row_entity(i) for i in range(n)]
+        self._moving_entities = entities
+        self.add_entities(entities)
             
+        self._update_visuals(0.0)
+        
         creation_time = time.time() - creation_start
         print(f"✓ Created {self.entity_count} entities in {creation_time:.3f}s")
         
@@ -182,6 +220,13 @@ class ThreadingDemoScene(BaseScene):
         
         print(f"✓ Scene initialized successfully")
         
+    def _create_row_entity(self, i: int) -> Entity:
+        """Create the entity viewing row i of the scene arrays."""
+        entity = Entity(float(self.pos_x[i]), float(self.pos_y[i]))
+        entity.add_component(MovementComponent(self, i))
+        entity.add_component(RenderComponent(self, i))
+        return entity
+        
     def update(self, delta_time: float):
         """Update scene with detailed performance tracking."""
         update_start = time.time()
@@ -189,36 +234,137 @@ class ThreadingDemoScene(BaseScene):
         # Call parent update (handles entity updates with threading)
         super().update(delta_time)
         
+        # Move and pulse every entity in one vectorized step
+        if self._is_loaded and self.pos_x is not None:
+            self._update_movement(delta_time)
+            self._update_visuals(delta_time)
+        
         update_time = time.time() - update_start
         
         # Track performance metrics
         self.update_times.append(update_time)
-        if len(self.update_times) > self.max_samples:
-            self.update_times.pop(0)
             
+    def _update_movement(self, dt: float):
+        """Advance all entities at once, bouncing off the screen edges."""
+        step, hit, below = self._step, self._hit, self._below
+        _move_axis(self.pos_x, self.dir_x, self.speed, dt, 800, step, hit, below, self.rng)
+        _move_axis(self.pos_y, self.dir_y, self.speed, dt, 600, step, hit, below, self.rng)
+        
+        # Occasionally change direction
+        self.bounce_timer += dt
+        turning = np.flatnonzero(np.greater(self.bounce_timer, self.bounce_cooldown, out=hit))
+        if turning.size:
+            dir_x, dir_y = self.dir_x, self.dir_y
+            jitter = self.rng.uniform(-0.5, 0.5, (2, turning.size))
+            new_x = dir_x[turning] + jitter[0]
+            new_y = dir_y[turning] + jitter[1]
+            # Normalize direction vector
+            length = np.hypot(new_x, new_y)
+            length[length == 0] = 1.0
+            dir_x[turning] = new_x / length
+            dir_y[turning] = new_y / length
+            self.bounce_timer[turning] = 0.0
+            self.bounce_cooldown[turning] = self.rng.uniform(1.5, 3.0, turning.size)
+            
+        # Publish the new positions to the entities
+        for entity, x, y in zip(self._moving_entities, self.pos_x.tolist(), self.pos_y.tolist()):
+            entity.position.update(x, y)
+            
+    def _update_visuals(self, dt: float):
+        """Advance the size pulse and color variation of all entities."""
+        self.pulse_timer += dt * self.pulse_speed
+        # Both waves repeat every 4*pi, so wrapping keeps the float32 timers precise
+        np.fmod(self.pulse_timer, 4 * np.pi, out=self.pulse_timer)
+        
+        # Table lookups instead of evaluating sin for every entity
+        mask = self.SIN_LUT_SIZE - 1
+        phase = (self.pulse_timer * (self.SIN_LUT_SIZE / (2 * np.pi))).astype(np.int32)
+        
+        # Pulse effect for size
+        pulse = 1.0 + 0.3 * self.SIN_LUT[phase & mask]
+        self.sizes = np.maximum(1, (self.base_sizes * pulse).astype(np.int32))
+        
+        # Subtle color variation
+        color_variation = 1.0 + 0.1 * self.SIN_LUT[(phase >> 1) & mask]
+        self.colors = np.clip(self.base_colors * color_variation[:, None], 0, 255).astype(np.int32)
+        
     def render(self, screen: pygame.Surface):
         """Render scene with comprehensive performance overlay."""
         render_start = time.time()
         
+        if not self._is_loaded or self.pos_x is None:
+            super().render(screen)
+            return
+            
         # Clear screen with gradient-like background
         screen.fill((10, 15, 25))  # Dark background for better contrast
         
-        # Render all entities
-        super().render(screen)
+        # Render all entities straight from the arrays
+        self._render_entities(screen)
         
         render_time = time.time() - render_start
         self.render_times.append(render_time)
-        if len(self.render_times) > self.max_samples:
-            self.render_times.pop(0)
         
         # Render performance overlay
         self._render_performance_overlay(screen)
         
+    def _render_entities(self, screen: pygame.Surface):
+        """Draw every entity as a cached sprite in one batched blit."""
+        # Quantize colors so entities share a bounded set of pre-rendered sprites
+        quantized = self.colors >> self.COLOR_SHIFT
+        keys = (((quantized[:, 0] << 6) | (quantized[:, 1] << 3) | quantized[:, 2]) << 4) | self.sizes
+        
+        # Sprites include the glow ring, so they are offset by the glow radius
+        offsets = self.sizes + 3
+        xs = (self.pos_x.astype(np.int32) - offsets).tolist()
+        ys = (self.pos_y.astype(np.int32) - offsets).tolist()
+        
+        sprites = self._circle_sprites
+        blits = []
+        for key, x, y in zip(keys.tolist(), xs, ys):
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = self._make_circle_sprite(key)
+            blits.append((sprite, (x, y)))
+        screen.blits(blits, False)
+        
+    def _make_circle_sprite(self, key: int) -> pygame.Surface:
+        """Pre-render the circle (and glow ring for larger sizes) encoded by a sprite key."""
+        size = key & 0xF
+        step = 1 << self.COLOR_SHIFT
+        color = tuple(((key >> shift) & 0x7) * step + step // 2 for shift in (10, 7, 4))
+        
+        radius = size + 3
+        sprite = pygame.Surface((radius * 2, radius * 2)).convert()
+        sprite.fill((0, 0, 0))
+        pygame.draw.circle(sprite, color, (radius, radius), size)
+        
+        # Add a subtle glow effect for larger entities
+        if size > 5:
+            glow_color = tuple(c // 3 for c in color)
+            pygame.draw.circle(sprite, glow_color, (radius, radius), size + 2, 1)
+            
+        sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return sprite
+        
     def _render_performance_overlay(self, screen: pygame.Surface):
         """Render detailed performance statistics and information."""
         if not self.font or not self.update_times:
             return
             
+        # Numbers are refreshed every few frames; nobody can read them at 60 Hz
+        if self._stats_tick % 10 == 0 or not self._info_lines:
+            self._info_lines = self._build_info_lines()
+        self._stats_tick += 1
+            
+        # Render main info panel
+        self._render_info_panel(screen, self._info_lines, 10, 10)
+        
+        # Render instructions
+        self._render_info_panel(screen, self.INSTRUCTIONS, 10, screen.get_height() - 220, self.small_font)
+        
+    def _build_info_lines(self) -> list:
+        """Format the current performance statistics."""
         # Calculate comprehensive metrics
         avg_update_time = sum(self.update_times) / len(self.update_times)
         min_update_time = min(self.update_times)
@@ -250,23 +396,7 @@ class ThreadingDemoScene(BaseScene):
             runtime = time.time() - self.start_time
             info_lines.append(f"Runtime: {runtime:.1f}s")
             
-        # Render main info panel
-        self._render_info_panel(screen, info_lines, 10, 10)
-        
-        # Render instructions
-        instructions = [
-            "Controls:",
-            "  ESC - Exit demo",
-            "  Watch performance metrics",
-            "",
-            "Features:",
-            "  • Multi-threaded entity updates",
-            "  • Real-time performance monitoring", 
-            "  • Adaptive visual effects",
-            "  • Realistic physics simulation"
-        ]
-        
-        self._render_info_panel(screen, instructions, 10, screen.get_height() - 220, self.small_font)
+        return info_lines
         
     def _render_info_panel(self, screen: pygame.Surface, lines: list, x: int, y: int, font=None):
         """Render an information panel with background."""
@@ -275,25 +405,41 @@ class ThreadingDemoScene(BaseScene):
             
         font = font or self.font
         
+        text_surfaces = [self._text(line, font) for line in lines]
+        
         # Calculate panel dimensions
         line_height = 25 if font == self.font else 20
-        panel_width = max(font.size(line)[0] for line in lines) + 20
+        panel_width = max(text_surface.get_width() for text_surface in text_surfaces) + 20
         panel_height = len(lines) * line_height + 10
         
         # Draw semi-transparent background
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(200)
-        panel_surface.fill((0, 0, 0))
+        panel_surface = self._panel_cache.get((panel_width, panel_height))
+        if panel_surface is None:
+            panel_surface = pygame.Surface((panel_width, panel_height)).convert()
+            panel_surface.set_alpha(200)
+            panel_surface.fill((0, 0, 0))
+            self._panel_cache[(panel_width, panel_height)] = panel_surface
         screen.blit(panel_surface, (x, y))
         
         # Draw border
         pygame.draw.rect(screen, (100, 100, 100), (x, y, panel_width, panel_height), 2)
         
         # Render text lines
-        for i, line in enumerate(lines):
-            if line.strip():  # Skip empty lines for spacing
-                text_surface = font.render(line, True, (255, 255, 255))
-                screen.blit(text_surface, (x + 10, y + 5 + i * line_height))
+        screen.blits([(text_surface, (x + 10, y + 5 + i * line_height))
+                      for i, (line, text_surface) in enumerate(zip(lines, text_surfaces))
+                      if line.strip()], False)  # Skip empty lines for spacing
+        
+    def _text(self, line: str, font: pygame.font.Font) -> pygame.Surface:
+        """Return the rendered surface for a line, rendering it only on first use."""
+        key = (line, font is self.small_font)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(line, True, (255, 255, 255))
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._text_cache[next(iter(self._text_cache))]
+            self._text_cache[key] = text_surface
+        return text_surface
     
     def handle_event(self, event: pygame.event.Event):
         """Handle scene-specific events."""
@@ -15,6 +15,11 @@ class MenuUI(Entity):
         self.ui.root.height = 600
         self.ui.root.background_color = (20, 20, 20)  # Dark background
         
+        # The menu only changes in response to events, so the UI tree is drawn into
+        # this surface when needed and the surface is blitted every frame
+        self._ui_surface = None
+        self._ui_dirty = True
+        
         # Create title
         self.title = self.ui.create_label(300, 100, "PyEngine Demo", font_size=48)
         self.title.set_text_color((255, 255, 0))  # Yellow text
@@ -33,7 +38,11 @@ class MenuUI(Entity):
             def wrapper():
                 click_sound = self.scene.get_resource('menu_click')
                 if click_sound:
-                    click_sound.play()
+                    channel = self.scene._click_channel
+                    if channel:
+                        channel.play(click_sound)
+                    else:
+                        click_sound.play()
                 callback()
             return wrapper
         
@@ -86,15 +95,35 @@ class MenuUI(Entity):
         if self.scene and self.scene.interface:
             self.scene.interface.running = False
 
+    def handle_event(self, event: pygame.event.Event):
+        """Handle events; hover, clicks and dialogs may change how the menu looks"""
+        super().handle_event(event)
+        self._ui_dirty = True
+
     def render(self, screen: pygame.Surface, camera_offset=(0, 0)):
         """Override render to ignore camera offset for UI"""
         if not self.visible:
             return
+        
+        size = screen.get_size()
+        if self._ui_surface is None or self._ui_surface.get_size() != size:
+            self._ui_dirty = True
+            
+        # Render all components without camera offset, only when something changed
+        if self._ui_dirty:
+            # An opaque full-screen root needs no per-pixel alpha, which makes the blit a plain copy
+            opaque = self.ui.is_fullscreen_opaque(size)
+            if (self._ui_surface is None or self._ui_surface.get_size() != size
+                    or bool(self._ui_surface.get_flags() & pygame.SRCALPHA) == opaque):
+                self._ui_surface = pygame.Surface(size, 0 if opaque else pygame.SRCALPHA)
+                if pygame.display.get_surface() is not None:
+                    self._ui_surface = self._ui_surface.convert() if opaque else self._ui_surface.convert_alpha()
+            self._ui_surface.fill((0, 0, 0, 0))
+            # The menu's only component; UIComponent.render checks enabled itself
+            self.ui.render(self._ui_surface, (0, 0))  # Always use (0, 0) for UI
+            self._ui_dirty = False
             
-        # Render all components without camera offset
-        for component in self.components.values():
-            if component.enabled:
-                component.render(screen, (0, 0))  # Always use (0, 0) for UI
+        screen.blit(self._ui_surface, (0, 0))
 
 class MenuScene(BaseScene):
     def __init__(self):
@@ -102,6 +131,12 @@ class MenuScene(BaseScene):
         print("MenuScene initialized")
         self.menu_ui = None
         self._is_loaded = False  # Start as not loaded
+        self.debug_draw = False  # Outline the UI root for debugging
+        # Resources used every frame / lifecycle hook, fetched once after loading
+        self._music = None
+        self._background = None
+        self._click_channel = None  # Reserved for button clicks
+        self._paused = False  # Another scene is on top: skip update and render
         
     def get_required_resources(self) -> dict:
         """Specify resources that need to be loaded"""
@@ -112,24 +147,17 @@ class MenuScene(BaseScene):
         }
         
     def load_resources(self):
-        """Load all required resources"""
-        print("Loading menu resources...")
-        required_resources = self.get_required_resources()
-        total_resources = len(required_resources)
-        loaded = 0
-
-        for name, path in required_resources.items():
-            try:
-                print(f"Loading resource: {path}")
-                self.add_resource(name, path)
-                loaded += 1
-                print(f"Successfully loaded: {path}")
-            except Exception as e:
-                print(f"Failed to load resource {name}: {e}")
-
-            self._loading_progress = (loaded / total_resources) * 100
+        """Load all required resources
+        
+        Called once per frame while loading; files are read in the background
+        (see BaseScene._load_resources_async), so the loading screen keeps updating.
+        """
+        self._loading_progress = self._load_resources_async(self.get_required_resources()) * 100
+        if self._loading_progress < 100:
+            return
 
-        print(f"Loaded {loaded}/{total_resources} resources")
+        self._music = self.get_resource('menu_music')
+        self._background = self.get_resource('menu_background')
         self._is_loaded = True
         
         # After resources are loaded, create the UI
@@ -144,9 +172,17 @@ class MenuScene(BaseScene):
         print(f"Added MenuUI to scene, total entities: {len(self.entities)}")
         
         # Start background music
-        music = self.get_resource('menu_music')
-        if music:
-            music.play(-1)  # Loop indefinitely
+        if self._music:
+            self._music.play(-1)  # Loop indefinitely
+        
+    def update(self, delta_time: float):
+        """Update the scene, continuing to load resources until they are all ready"""
+        if not self._is_loaded:
+            self.load_resources()
+            return
+        if self._paused:
+            return
+        super().update(delta_time)
         
     def on_initialize(self):
         """One-time initialization"""
@@ -154,49 +190,53 @@ class MenuScene(BaseScene):
         # Initialize pygame mixer if using sound
         if not pygame.mixer.get_init():
             pygame.mixer.init()
+        
+        # Keep a channel for clicks, so they play right away and music never takes it
+        pygame.mixer.set_reserved(1)
+        self._click_channel = pygame.mixer.Channel(0)
             
     def on_enter(self, previous_scene):
         """Called when scene becomes active"""
         print("MenuScene on_enter called")
         super().on_enter(previous_scene)
         # Start background music if available
-        music = self.get_resource('menu_music')
-        if music:
-            music.play(-1)  # Loop indefinitely
+        if self._music:
+            self._music.play(-1)  # Loop indefinitely
             
     def on_exit(self):
         """Called when switching to another scene"""
         print("MenuScene on_exit called")
         # Stop background music
-        music = self.get_resource('menu_music')
-        if music:
-            music.stop()
+        if self._music:
+            self._music.stop()
         super().on_exit()
             
     def on_pause(self):
         """Called when another scene is pushed on top"""
         print("MenuScene on_pause called")
+        self._paused = True
         # Pause background music
-        music = self.get_resource('menu_music')
-        if music:
-            music.pause()
+        if self._music:
+            self._music.pause()
         super().on_pause()
             
     def on_resume(self):
         """Called when scene is resumed (top scene was popped)"""
         print("MenuScene on_resume called")
+        self._paused = False
         # Unpause background music
-        music = self.get_resource('menu_music')
-        if music:
-            music.unpause()
+        if self._music:
+            self._music.unpause()
         super().on_resume()
     
     def render(self, screen: pygame.Surface):
         """Render the scene"""
+        if self._paused:
+            return
+            
         # Draw background
-        background = self.get_resource('menu_background')
-        if background:
-            screen.blit(background, (0, 0))
+        if self._background:
+            screen.blit(self._background, (0, 0))
         else:
             screen.fill((20, 20, 20))
         
@@ -204,14 +244,15 @@ class MenuScene(BaseScene):
         super().render(screen)
         
         # Debug: Draw rectangles around UI elements
-        if self.menu_ui and self.menu_ui.ui:
+        if self.debug_draw and self.menu_ui and self.menu_ui.ui:
             pygame.draw.rect(screen, (255, 0, 0), 
                            (self.menu_ui.ui.root.x, self.menu_ui.ui.root.y,
                             self.menu_ui.ui.root.width, self.menu_ui.ui.root.height), 1)
         
     def cleanup(self):
         """Clean up scene resources"""
-        music = self.get_resource('menu_music')
-        if music:
-            music.stop()
+        if self._music:
+            self._music.stop()
         super().cleanup()
+        self._music = None
+        self._background = None
@@ -13,6 +13,8 @@ from engine.core.components.tilemap import TileMap
 from engine.core.components.network_component import NetworkComponent
 from engine.core.entity import Entity
 from engine.core.scenes.base_scene import BaseScene
+from engine.core.components.ui.font_registry import get_font, render_text, clear_fonts, on_fonts_cleared
+from engine.core.components.sprite_animation import SpriteAnimation, Animation
 
 # Use headless mode for pygame
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -49,6 +51,59 @@ def test_astar_basic():
     assert path[-1] == (2, 2)
 
 
+def test_get_font_shares_fonts_per_size():
+    font = get_font(30)
+    assert get_font(30) is font
+    assert get_font(31) is not font
+    assert font.get_height() == pygame.font.Font(None, 30).get_height()
+
+
+def test_clear_fonts_drops_shared_fonts_and_renders():
+    font = get_font(30)
+    text = render_text("Title", 30, (255, 255, 255))
+    cleared = []
+    on_fonts_cleared(lambda: cleared.append(True))
+    clear_fonts()
+    assert get_font(30) is not font
+    assert render_text("Title", 30, (255, 255, 255)) is not text
+    assert cleared == [True]
+
+
+def test_labels_share_fonts_per_size():
+    from engine.core.components.ui.label import Label
+    first, second = Label(0, 0, "a", font_size=20), Label(0, 0, "b", font_size=20)
+    assert first.font is second.font is get_font(20)
+
+
+def test_labels_share_rendered_static_text():
+    from engine.core.components.ui.label import Label
+    first, second = Label(0, 0, "Title", font_size=20), Label(0, 0, "Title", font_size=20)
+    assert first._text_surface is second._text_surface is render_text("Title", 20, (255, 255, 255))
+    render_text.cache_clear()
+    first.set_text("Score: 1")
+    assert render_text.cache_info().currsize == 0
+
+
+def test_sprite_animation_flip_swaps_cached_frames():
+    frame = pygame.Surface((2, 1), pygame.SRCALPHA)
+    frame.set_at((0, 0), (255, 0, 0, 255))
+    anim = SpriteAnimation()
+    anim.animations["walk"] = Animation("walk", [frame])
+    anim.play("walk")
+    anim.set_animation_speed("walk", 2.0)
+    original = anim.current_animation.frames
+
+    anim.set_flip(True, False)
+    flipped = anim.current_animation.frames
+    assert flipped[0].get_at((1, 0)) == pygame.Color(255, 0, 0, 255)
+    assert anim.current_animation.speed_multiplier == 2.0
+
+    anim.set_flip(False, False)
+    assert anim.current_animation.frames is original
+    anim.set_flip(True, False)
+    assert anim.current_animation.frames is flipped
+
+
 class DummyInterface:
     def __init__(self):
         self.clock = pygame.time.Clock()
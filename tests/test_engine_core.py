@@ -1,14 +1,22 @@
+import os
+import tempfile
 import unittest
 import pygame
 from unittest.mock import Mock, patch
 
 from engine.core.entity import Entity
+from engine.core.entity_pool import EntityPool
 from engine.core.component import Component
 from engine.core.input import Input
 from engine.core.components.state_machine_component import StateMachineComponent
 from engine.core.components.timer_component import TimerComponent
 from engine.core.components.health_component import HealthComponent
 from engine.core.components.inventory_component import InventoryComponent
+from engine.core.components.collider import Collider
+from engine.core.components.physics import Physics
+from engine.core.scenes.collision_system import CollisionSystem
+from engine.core.scenes.base_scene import BaseScene
+from engine.core.thread_pool import ThreadPool
 
 class TestEntity(unittest.TestCase):
     def setUp(self):
@@ -340,4 +348,205 @@ class TestInventoryComponent(unittest.TestCase):
         self.assertEqual(self.inventory_component.get_item_count(), 2)
         self.assertEqual(self.inventory_component.get_items(), ["item1", "item2"])
 
-
+class TestCollisionSystem(unittest.TestCase):
+    def _make_entity(self, x, y, width=10, height=10):
+        entity = Entity(x, y)
+        entity.add_component(Collider(width, height))
+        return entity
+
+    def test_broad_phase_only_pairs_overlapping_boxes(self):
+        system = CollisionSystem(use_spatial_partitioning=False)
+        a = self._make_entity(0, 0)
+        b = self._make_entity(5, 5)
+        c = self._make_entity(100, 0)
+        d = self._make_entity(5, 100)
+        system._update_caches([a, b, c, d])
+        pairs = system._sweep_and_prune([a, b, c, d])
+        self.assertEqual({frozenset((e1.id, e2.id)) for e1, e2 in pairs}, {frozenset((a.id, b.id))})
+
+    def test_update_reports_colliding_pairs(self):
+        system = CollisionSystem(use_spatial_partitioning=False)
+        a = self._make_entity(0, 0)
+        b = self._make_entity(5, 5)
+        c = self._make_entity(100, 100)
+        system.update([a, b, c])
+        self.assertEqual(system.get_colliding_pairs(), {tuple(sorted((a.id, b.id)))})
+
+    def test_spatial_grid_buckets_static_colliders_once(self):
+        system = CollisionSystem(use_spatial_partitioning=True, grid_cell_size=64)
+        ground = self._make_entity(400, 550, 800, 40)
+        ground.add_component(Physics()).set_kinematic(True)
+        player = self._make_entity(400, 520, 40, 40)
+        system.update([ground, player])
+        self.assertEqual(system.get_colliding_pairs(), {tuple(sorted((ground.id, player.id)))})
+        self.assertFalse(system.spatial_grid.sync_static([ground], system._collider_cache))
+
+        player.position.y = 100
+        system.update([ground, player])
+        self.assertEqual(system.get_colliding_pairs(), set())
+
+    def test_spatial_grid_reports_static_pairs_and_resizes(self):
+        system = CollisionSystem(use_spatial_partitioning=True, grid_cell_size=64)
+        wall = self._make_entity(0, 0, 20, 20)
+        wall.add_component(Physics()).set_kinematic(True)
+        trigger = self._make_entity(100, 0, 20, 20)
+        trigger.add_component(Physics()).set_kinematic(True)
+        system.update([wall, trigger])
+        self.assertEqual(system.get_colliding_pairs(), set())
+
+        # Growing a static collider re-buckets it even though it did not move
+        wall.get_component(Collider).width = 200
+        system.update([wall, trigger])
+        self.assertEqual(system.get_colliding_pairs(), {tuple(sorted((wall.id, trigger.id)))})
+        system.update([wall, trigger])
+        self.assertEqual(system.get_colliding_pairs(), {tuple(sorted((wall.id, trigger.id)))})
+
+    def test_parallel_grid_queries_match_serial(self):
+        entities = [self._make_entity((i % 40) * 8, (i // 40) * 8) for i in range(400)]
+        ground = self._make_entity(160, 90, 400, 20)
+        ground.add_component(Physics()).set_kinematic(True)
+        entities.append(ground)
+
+        serial = CollisionSystem(use_spatial_partitioning=True, grid_cell_size=64)
+        serial._update_caches(entities)
+        expected = {frozenset((e1.id, e2.id)) for e1, e2 in serial._broad_phase_collision_detection(entities)}
+
+        parallel = CollisionSystem(use_spatial_partitioning=True, grid_cell_size=64)
+        parallel._update_caches(entities)
+        with ThreadPool(max_workers=4) as pool:
+            pairs = parallel._broad_phase_collision_detection(entities, pool)
+        self.assertEqual(len(pairs), len(expected))
+        self.assertEqual({frozenset((e1.id, e2.id)) for e1, e2 in pairs}, expected)
+
+class TestEntityPool(unittest.TestCase):
+    def test_acquire_reuses_released_entities(self):
+        pool = EntityPool(Entity, initial=2)
+        self.assertEqual(pool.available, 2)
+        first = pool.acquire()
+        self.assertTrue(first.active and first.visible)
+        pool.release(first)
+        self.assertFalse(first.active or first.visible)
+        self.assertIs(pool.acquire(), first)
+
+    def test_acquire_resets_recycled_entities(self):
+        pool = EntityPool(Entity, initial=1, reset=lambda entity: entity.set_velocity(0, 0))
+        entity = pool.acquire()
+        entity.set_velocity(5, 5)
+        pool.release(entity)
+        self.assertEqual(pool.acquire().velocity, (0, 0))
+
+    def test_released_entities_stop_colliding(self):
+        pool = EntityPool(self._make_colliding_entity, initial=2)
+        scene = BaseScene()
+        scene._is_loaded = True
+        first, second = pool.acquire(), pool.acquire()
+        scene.add_entities([first, second])
+        scene.update(0.016)
+        self.assertEqual(scene.collision_system.get_colliding_pairs(), {tuple(sorted((first.id, second.id)))})
+
+        pool.release(second)
+        second.on_collision = Mock()
+        scene.update(0.016)
+        self.assertEqual(scene.collision_system.get_colliding_pairs(), set())
+        second.on_collision.assert_not_called()
+
+    def _make_colliding_entity(self):
+        entity = Entity(0, 0)
+        entity.add_component(Collider(10, 10))
+        return entity
+
+    def test_acquire_grows_when_empty(self):
+        pool = EntityPool(Entity, initial=1)
+        pool.acquire()
+        extra = pool.acquire()
+        self.assertIsInstance(extra, Entity)
+        self.assertEqual(pool.available, 0)
+
+class TestBaseSceneEntities(unittest.TestCase):
+    def test_add_entities_matches_add_entity(self):
+        scene = BaseScene()
+        existing = Entity()
+        scene.add_entity(existing)
+        entities = [Entity() for _ in range(3)]
+        scene.add_entities(entities + [existing, entities[0]], "enemies")
+        self.assertEqual(scene.entities, [existing] + entities)
+        self.assertEqual(scene.get_entities_by_group("enemies"), entities)
+        self.assertEqual(scene.get_entities_by_group("default"), [existing])
+        for entity in entities:
+            self.assertIs(entity.scene, scene)
+
+    def test_remove_entities_matches_remove_entity(self):
+        scene = BaseScene()
+        entities = [Entity() for _ in range(4)]
+        scene.add_entities(entities)
+        scene.remove_entities(entities[1:3])
+        self.assertEqual(scene.entities, [entities[0], entities[3]])
+        self.assertEqual(scene.get_entities_by_group("default"), [entities[0], entities[3]])
+        self.assertIsNone(entities[1].scene)
+        self.assertIs(entities[0].scene, scene)
+
+    def test_add_resource_twice_loads_once(self):
+        scene = BaseScene()
+        scene.resource_loader = Mock()
+        scene.resource_loader.load_resource.return_value = "surface"
+        scene.resource_loader.get_resource.return_value = "surface"
+        scene.add_resource("background", "background.png")
+        scene.add_resource("background", "background.png")
+        scene.resource_loader.load_resource.assert_called_once_with("background.png", "background", None)
+        self.assertEqual(scene.get_resource("background"), "surface")
+
+    def test_load_resources_async_reads_shared_paths_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "background.png")
+            with open(path, "wb") as f:
+                f.write(b"data")
+            scene = BaseScene()
+            scene.resource_loader = Mock()
+            scene.resource_loader.load_resource.return_value = "surface"
+            scene.resource_loader.get_resource.return_value = None
+            progress = 0.0
+            while progress < 1.0:
+                progress = scene._load_resources_async({"background": path, "sprite": path})
+        scene.resource_loader.load_resource.assert_any_call(path, "background", b"data")
+        self.assertEqual(scene.resource_loader.load_resource.call_count, 2)  # decode + alias reference
+        self.assertEqual(scene._resources["sprite"], scene._resources["background"])
+        self.assertIsNone(scene._pending_resources)
+
+    def test_update_skips_entities_driven_by_scene_systems(self):
+        class SystemDriven(Component):
+            needs_update = False
+
+        scene = BaseScene()
+        scene._is_loaded = True
+        passive = Entity()
+        passive.add_component(SystemDriven())
+        mixed = Entity()
+        mixed.add_component(SystemDriven())
+        mixed.add_component(Component())
+        scene.add_entities([passive, mixed])
+        self.assertFalse(passive.needs_update)
+        self.assertTrue(mixed.needs_update)
+
+        with patch.object(Entity, '_perform_update') as perform_update:
+            scene.update(0.016)
+        self.assertEqual(perform_update.call_count, 1)
+
+        # A moving entity is still integrated even though its components opted out
+        passive.set_velocity(100, 0)
+        scene.update(0.5)
+        self.assertEqual(passive.position.x, 50)
+
+    def test_few_colliders_keep_the_spatial_grid(self):
+        scene = BaseScene()
+        scene._is_loaded = True
+        wall = Entity(0, 0)
+        wall.add_component(Collider(10, 10))
+        wall.add_component(Physics()).set_kinematic(True)
+        box = Entity(5, 5)
+        box.add_component(Collider(10, 10))
+        scene.add_entities([wall, box])
+        grid = scene.collision_system.spatial_grid
+        scene.update(0.016)
+        scene.update(0.016)
+        self.assertIs(scene.collision_system.spatial_grid, grid)
+        self.assertEqual(scene.collision_system.get_colliding_pairs(), {tuple(sorted((wall.id, box.id)))})
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import time
 from engine.multiplayer import DedicatedServer, Client, SyncComponent
 from engine.core.entity import Entity
@@ -138,3 +140,45 @@ def test_new_client_receives_existing_players():
     server.stop()
 
     assert any(m.get('cmd') == 'join' and m.get('player') == 'p1' for m in received)
+
+
+def test_async_serve_relays_updates():
+    server = DedicatedServer('127.0.0.1', port=0)
+    loop = asyncio.new_event_loop()
+    shutdown_event = asyncio.Event()
+    thread = threading.Thread(target=loop.run_until_complete, args=(server.serve(shutdown_event),), daemon=True)
+    thread.start()
+
+    for _ in range(50):
+        time.sleep(0.01)
+        if server.running:
+            break
+    port = server.sock.getsockname()[1]
+
+    received = []
+    client1 = Client('p1', '127.0.0.1', port)
+    client2 = Client('p2', '127.0.0.1', port)
+    client2.recv_callback = lambda m: received.append(m)
+    client1.start()
+    client2.start()
+
+    for _ in range(50):
+        time.sleep(0.01)
+        if len(server.clients) == 2:
+            break
+
+    client1.send_update({'x': 7})
+
+    for _ in range(50):
+        time.sleep(0.01)
+        if any(m.get('cmd') == 'update' for m in received):
+            break
+
+    client1.stop()
+    client2.stop()
+    loop.call_soon_threadsafe(shutdown_event.set)
+    thread.join(timeout=1)
+    loop.close()
+
+    assert not server.running
+    assert any(m.get('cmd') == 'update' and m.get('data', {}).get('x') == 7 for m in received)